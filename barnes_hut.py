@@ -0,0 +1,186 @@
+"""
+Barnes-Hut octree for approximate N-body gravitational accelerations
+"""
+
+import numpy as np
+from data.constants import G
+
+
+class Octree:
+    """Octree over a set of point masses, stored as flat per-node arrays.
+
+    Node 0 is the root cube enclosing every body. Each node keeps its
+    geometric centre, width, total mass, centre of mass, eight child
+    indices (-1 when absent) and, for leaves, the index of the body it holds.
+    """
+
+    def __init__(self, positions, masses):
+        positions = np.asarray(positions, dtype=np.float64)
+        masses = np.asarray(masses, dtype=np.float64)
+        n_bodies = len(masses)
+
+        capacity = max(2 * n_bodies + 1, 8)
+        self.center = np.zeros((capacity, 3))
+        self.width = np.zeros(capacity)
+        self.total_mass = np.zeros(capacity)
+        self.center_of_mass = np.zeros((capacity, 3))
+        self.children = np.full((capacity, 8), -1, dtype=np.int64)
+        self.body = np.full(capacity, -1, dtype=np.int64)
+        self.n_nodes = 0
+        self._coincident = {}
+
+        # Root cell: smallest cube enclosing all bodies
+        lower = positions.min(axis=0)
+        upper = positions.max(axis=0)
+        root_width = max((upper - lower).max(), 1.0) * 1.0001
+        self._new_node((lower + upper) / 2, root_width)
+
+        for i in range(n_bodies):
+            self._insert(i, positions)
+
+        self._compute_mass_distribution(positions, masses)
+
+    def _new_node(self, center, width):
+        """Append an empty node and return its index"""
+        if self.n_nodes == len(self.width):
+            self._grow()
+
+        node = self.n_nodes
+        self.center[node] = center
+        self.width[node] = width
+        self.n_nodes += 1
+        return node
+
+    def _grow(self):
+        """Double the capacity of the node arrays"""
+        capacity = 2 * len(self.width)
+        for name in ('center', 'center_of_mass'):
+            array = np.zeros((capacity, 3))
+            array[:self.n_nodes] = getattr(self, name)[:self.n_nodes]
+            setattr(self, name, array)
+        for name in ('width', 'total_mass'):
+            array = np.zeros(capacity)
+            array[:self.n_nodes] = getattr(self, name)[:self.n_nodes]
+            setattr(self, name, array)
+
+        children = np.full((capacity, 8), -1, dtype=np.int64)
+        children[:self.n_nodes] = self.children[:self.n_nodes]
+        self.children = children
+        body = np.full(capacity, -1, dtype=np.int64)
+        body[:self.n_nodes] = self.body[:self.n_nodes]
+        self.body = body
+
+    def _octant(self, node, position):
+        """Index (0-7) of the child octant of `node` containing `position`"""
+        c = self.center[node]
+        return ((position[0] > c[0]) * 1 +
+                (position[1] > c[1]) * 2 +
+                (position[2] > c[2]) * 4)
+
+    def _child(self, node, octant):
+        """Return the child node for an octant, creating it if needed"""
+        child = self.children[node, octant]
+        if child < 0:
+            half = self.width[node] / 2
+            offset = np.array([(octant & 1) - 0.5,
+                               ((octant >> 1) & 1) - 0.5,
+                               ((octant >> 2) & 1) - 0.5]) * half
+            child = self._new_node(self.center[node] + offset, half)
+            self.children[node, octant] = child
+        return child
+
+    def _insert(self, i, positions):
+        """Insert body i, subdividing leaves until each holds one body"""
+        node = 0
+        while True:
+            is_leaf = (self.children[node] < 0).all()
+
+            if is_leaf and self.body[node] < 0:
+                self.body[node] = i
+                return
+
+            if is_leaf:
+                other = self.body[node]
+                if np.array_equal(positions[other], positions[i]):
+                    # Coincident bodies cannot be separated; the leaf keeps
+                    # both and only its aggregate mass is used.
+                    self._coincident.setdefault(node, []).append(i)
+                    return
+                self.body[node] = -1
+                # _child may grow the node arrays, so look self.body up after it
+                child = self._child(node, self._octant(node, positions[other]))
+                self.body[child] = other
+                if node in self._coincident:
+                    self._coincident[child] = self._coincident.pop(node)
+
+            node = self._child(node, self._octant(node, positions[i]))
+
+    def _compute_mass_distribution(self, positions, masses):
+        """Accumulate total mass and centre of mass bottom-up"""
+        # Children are always created after their parent, so a reverse
+        # sweep visits every child before the node that owns it.
+        for node in range(self.n_nodes - 1, -1, -1):
+            i = self.body[node]
+            if i >= 0:
+                members = [i] + self._coincident.get(node, [])
+                m = masses[members]
+                self.total_mass[node] = m.sum()
+                self.center_of_mass[node] = positions[i]
+                continue
+
+            children = self.children[node][self.children[node] >= 0]
+            if len(children) == 0:
+                continue
+            m = self.total_mass[children]
+            total = m.sum()
+            self.total_mass[node] = total
+            if total > 0:
+                self.center_of_mass[node] = (m[:, None] * self.center_of_mass[children]).sum(axis=0) / total
+
+    def traverse(self, x, y, z, theta=0.5):
+        """Gravitational acceleration at (x, y, z) from the whole tree.
+
+        A node is treated as a single pseudo-particle when width / distance
+        is below `theta`; otherwise its children are visited. Nodes located
+        exactly at the query point (the body itself) are skipped.
+        """
+        acceleration = np.zeros(3)
+        theta2 = theta * theta
+        stack = [0]
+
+        while stack:
+            node = stack.pop()
+            m = self.total_mass[node]
+            if m == 0:
+                continue
+
+            dx = self.center_of_mass[node, 0] - x
+            dy = self.center_of_mass[node, 1] - y
+            dz = self.center_of_mass[node, 2] - z
+            r2 = dx * dx + dy * dy + dz * dz
+            is_leaf = self.body[node] >= 0
+            if r2 == 0:
+                # A leaf here is the body itself (or bodies coincident with
+                # it); a cell whose centre of mass happens to fall on the
+                # query point still has other bodies inside
+                if not is_leaf:
+                    stack.extend(c for c in self.children[node] if c >= 0)
+                continue
+
+            if is_leaf or self.width[node] ** 2 < theta2 * r2:
+                factor = G * m * r2 ** -1.5
+                acceleration[0] += factor * dx
+                acceleration[1] += factor * dy
+                acceleration[2] += factor * dz
+            else:
+                stack.extend(c for c in self.children[node] if c >= 0)
+
+        return acceleration
+
+    def accelerations(self, positions, theta=0.5):
+        """Accelerations for every position, shape (N, 3)"""
+        positions = np.asarray(positions)
+        result = np.empty((len(positions), 3))
+        for i, (x, y, z) in enumerate(positions):
+            result[i] = self.traverse(x, y, z, theta)
+        return result
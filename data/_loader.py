@@ -0,0 +1,33 @@
+"""
+Cached loading of planet_data.json
+"""
+import functools
+import json
+import os
+
+try:
+    import orjson
+except ImportError:
+    # The standard library parser is slower but reads the same file
+    orjson = None
+
+PLANET_DATA_PATH = os.path.join('data', 'planet_data.json')
+
+
+@functools.lru_cache(maxsize=1)
+def _load(path, mtime):
+    """Parse the JSON file; mtime is only part of the cache key"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def load_planet_data_cached(path=PLANET_DATA_PATH):
+    """Parsed planet data, read from disk only when the file has changed.
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    path = os.path.abspath(path)
+    return _load(path, os.path.getmtime(path))
@@ -1,18 +1,23 @@
 """
 Astronomical constants and conversion factors
 """
+import numpy as np
+
 # Astronomical Unit in meters
-AU = 149597870700  # meters
+AU = np.float64(149597870700)  # meters
 
 # Gravitational constant (m^3 kg^-1 s^-2)
-G = 6.67430e-11
+G = np.float64(6.67430e-11)
 
 # Solar mass (kg)
-SOLAR_MASS = 1.989e30
+SOLAR_MASS = np.float64(1.989e30)
 
 # Time conversions
 SECONDS_PER_DAY = 86400
 DAYS_PER_YEAR = 365.25
 
 # Speed of light (m/s)
-C = 299792458
+C = np.float64(299792458)
+
+# Derived constants, precomputed so hot paths multiply instead of divide
+INV_AU = np.float64(1.0) / AU  # 1/m
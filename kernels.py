@@ -0,0 +1,225 @@
+"""
+Numba-compiled kernels for the N-body integrator
+"""
+
+import functools
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Without Numba the kernels still run, just as plain Python loops
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def accelerations(pos, mass, G, acc):
+    """Fill acc (N, 3) with the gravitational acceleration on every body"""
+    n = pos.shape[0]
+    for i in prange(n):
+        ax = 0.0
+        ay = 0.0
+        az = 0.0
+        for j in range(n):
+            if j == i:
+                continue
+            dx = pos[j, 0] - pos[i, 0]
+            dy = pos[j, 1] - pos[i, 1]
+            dz = pos[j, 2] - pos[i, 2]
+            r2 = dx * dx + dy * dy + dz * dz
+            if r2 > 0.0:
+                factor = G * mass[j] * r2 ** -1.5
+                ax += factor * dx
+                ay += factor * dy
+                az += factor * dz
+        acc[i, 0] = ax
+        acc[i, 1] = ay
+        acc[i, 2] = az
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def step_leapfrog(pos, vel, acc, mass, dt, G):
+    """Advance pos and vel in place by one kick-drift-kick leapfrog step.
+
+    acc must hold the accelerations at pos on entry; on exit it holds the
+    accelerations at the new positions, ready for the next step.
+    """
+    n = pos.shape[0]
+    half_dt = 0.5 * dt
+    for i in prange(n):
+        for k in range(3):
+            vel[i, k] += half_dt * acc[i, k]
+            pos[i, k] += dt * vel[i, k]
+
+    accelerations(pos, mass, G, acc)
+
+    for i in prange(n):
+        for k in range(3):
+            vel[i, k] += half_dt * acc[i, k]
+
+
+@njit(fastmath=True, cache=True)
+def kepler_xyz(a, e, inc, w, W, cos_t, sin_t):
+    """Sample a Keplerian orbit on a precomputed angle grid.
+
+    cos_t and sin_t are the cosine and sine of the argument of latitude
+    at every sample, so one grid can be shared by all orbits in a plot.
+    a is in any length unit, angles are in radians. Returns (x, y, z)
+    arrays in the same unit as a.
+    """
+    n = cos_t.shape[0]
+    x = np.empty(n)
+    y = np.empty(n)
+    z = np.empty(n)
+    p = a * (1.0 - e * e)
+    cos_w = math.cos(w)
+    sin_w = math.sin(w)
+    cos_W = math.cos(W)
+    sin_W = math.sin(W)
+    cos_i = math.cos(inc)
+    sin_i = math.sin(inc)
+    for k in range(n):
+        # cos of the true anomaly, theta - w
+        cos_nu = cos_t[k] * cos_w + sin_t[k] * sin_w
+        r = p / (1.0 + e * cos_nu)
+        x[k] = r * (cos_W * cos_t[k] - sin_W * sin_t[k] * cos_i)
+        y[k] = r * (sin_W * cos_t[k] + cos_W * sin_t[k] * cos_i)
+        z[k] = r * sin_t[k] * sin_i
+    return x, y, z
+
+
+@njit(fastmath=True, cache=True)
+def planar_orbits(a, e, cos_t, sin_t):
+    """Sample many Keplerian orbits in their own plane in one fused pass.
+
+    Orbit i has semi-major axis a[i] and eccentricity e[i], with
+    perihelion on the +x axis; cos_t and sin_t are the shared angle grid.
+    Returns (xs, ys), each of shape (len(a), len(cos_t)) in the unit of a.
+    """
+    n = a.shape[0]
+    m = cos_t.shape[0]
+    xs = np.empty((n, m))
+    ys = np.empty((n, m))
+    for i in range(n):
+        p = a[i] * (1.0 - e[i] * e[i])
+        for k in range(m):
+            r = p / (1.0 + e[i] * cos_t[k])
+            xs[i, k] = r * cos_t[k]
+            ys[i, k] = r * sin_t[k]
+    return xs, ys
+
+
+# Step weights of the symplectic integrators, each a sequence of leapfrog
+# sub-steps. Yoshida's 4th-order scheme is three leapfrog steps with a
+# backwards middle step.
+LEAPFROG_WEIGHTS = np.array([1.0])
+_CBRT2 = 2.0 ** (1.0 / 3.0)
+YOSHIDA4_WEIGHTS = np.array([1.0 / (2.0 - _CBRT2), -_CBRT2 / (2.0 - _CBRT2), 1.0 / (2.0 - _CBRT2)])
+
+
+@njit(fastmath=True, cache=True)
+def integrate(pos, vel, mass, G, dt, weights, out_pos, out_vel, pos_scale):
+    """Run a whole fixed-step symplectic integration in compiled code.
+
+    Takes one step of length dt per output sample, made of a leapfrog
+    sub-step for every entry in weights. Row 0 of out_pos / out_vel
+    receives the initial state; positions are multiplied by pos_scale
+    when stored. pos and vel are advanced in place.
+    """
+    n = pos.shape[0]
+    acc = np.empty((n, 3))
+    accelerations(pos, mass, G, acc)
+
+    for s in range(out_pos.shape[0]):
+        if s > 0:
+            for w in weights:
+                step_leapfrog(pos, vel, acc, mass, w * dt, G)
+        for i in range(n):
+            for k in range(3):
+                out_pos[s, i, k] = pos[i, k] * pos_scale
+                out_vel[s, i, k] = vel[i, k]
+
+
+# Newton step size at which kepler_E stops, and its iteration cap
+KEPLER_TOL = 1e-14
+KEPLER_MAX_ITER = 50
+
+
+@njit(cache=True)
+def _kepler_E(M, e, E):
+    """Fill the flat array E with the eccentric anomaly for flat M and e"""
+    for k in range(M.shape[0]):
+        # Danby's starting guess keeps Newton's method stable up to e -> 1
+        x = M[k] + 0.85 * e[k] * math.copysign(1.0, math.sin(M[k]))
+        for _ in range(KEPLER_MAX_ITER):
+            dx = (x - e[k] * math.sin(x) - M[k]) / (1.0 - e[k] * math.cos(x))
+            x -= dx
+            if abs(dx) < KEPLER_TOL:
+                break
+        E[k] = x
+
+
+def kepler_E(M, e):
+    """Eccentric anomaly E solving Kepler's equation M = E - e sin(E).
+
+    M and e broadcast together, with 0 <= e < 1. Newton's method runs
+    until the step drops below KEPLER_TOL, so the result stays accurate
+    for highly eccentric orbits too (checked up to e = 0.999). The loop
+    is compiled on first use, so importing this module stays cheap.
+    """
+    M, e = np.broadcast_arrays(np.asarray(M, dtype=np.float64), np.asarray(e, dtype=np.float64))
+    E = np.empty(M.shape)
+    _kepler_E(M.ravel(), e.ravel(), E.reshape(-1))
+    return E
+
+
+# Grid for the tabulated Kepler solver: mean anomaly over one turn and
+# eccentricity up to KEPLER_TABLE_E_MAX. Bilinear interpolation on this
+# grid is accurate to better than 1e-5, plenty for plotting.
+KEPLER_TABLE_N_M = 2048
+KEPLER_TABLE_N_E = 128
+KEPLER_TABLE_E_MAX = 0.5
+
+
+@functools.lru_cache(maxsize=None)
+def _kepler_tables():
+    """sin(E) and cos(E) on the (M, e) grid, built once on first use"""
+    M = np.linspace(0.0, 2.0 * np.pi, KEPLER_TABLE_N_M + 1)
+    e = np.linspace(0.0, KEPLER_TABLE_E_MAX, KEPLER_TABLE_N_E)
+    E = kepler_E(M[:, None], e[None, :])
+    return np.sin(E), np.cos(E)
+
+
+def kepler_sincos(M, e):
+    """sin(E) and cos(E) of the eccentric anomaly by table lookup.
+
+    A branch-free alternative to kepler_E when only the trig of E is
+    needed: bilinear interpolation on a precomputed (M, e) grid.
+    M and e broadcast together; e must not exceed KEPLER_TABLE_E_MAX.
+    """
+    e = np.asarray(e, dtype=np.float64)
+    if np.any(e > KEPLER_TABLE_E_MAX):
+        raise ValueError(f"tabulated Kepler solver only covers e <= {KEPLER_TABLE_E_MAX}")
+    sin_table, cos_table = _kepler_tables()
+
+    m = np.mod(M, 2.0 * np.pi) * (KEPLER_TABLE_N_M / (2.0 * np.pi))
+    i = np.minimum(m.astype(np.int64), KEPLER_TABLE_N_M - 1)
+    fi = m - i
+    x = e * ((KEPLER_TABLE_N_E - 1) / KEPLER_TABLE_E_MAX)
+    j = np.minimum(x.astype(np.int64), KEPLER_TABLE_N_E - 2)
+    fj = x - j
+
+    def lookup(table):
+        return ((1.0 - fi) * ((1.0 - fj) * table[i, j] + fj * table[i, j + 1]) +
+                fi * ((1.0 - fj) * table[i + 1, j] + fj * table[i + 1, j + 1]))
+
+    return lookup(sin_table), lookup(cos_table)
+
@@ -1,12 +1,29 @@
+import atexit
+import os
+import sys
+import tempfile
+import threading
+import webbrowser
 import tkinter as tk
 from tkinter import ttk
+import matplotlib
+
+# Scripted PNG export needs no GUI canvas; pick Agg before pyplot loads
+HEADLESS = '--headless' in sys.argv or (
+    sys.platform.startswith('linux') and not os.environ.get('DISPLAY'))
+if HEADLESS:
+    matplotlib.use('Agg')
+
+# Screen resolution by default; --publication restores print quality
+DPI = 300 if '--publication' in sys.argv else 150
+
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 
+from simulation_cache import load_or_simulate
 from solar_system import SolarSystem
 from visualization import SolarSystemVisualizer
-from statistics import SolarSystemStatistics
 
 
 class SolarSystemApp:
@@ -17,12 +34,50 @@ class SolarSystemApp:
 
         # Initialize solar system
         self.solar_system = SolarSystem()
+        self.visualizer = None
+        self.statistics = None
 
-        # Run simulation
-        print("Running simulation...")
-        self.solar_system.simulate(time_span=365 * 2, n_steps=1000)  # 2 years
+        # One HTML file per app, rewritten by every 3D click and removed on exit
+        fd, self.plot_3d_path = tempfile.mkstemp(prefix='solar_system_3d_', suffix='.html')
+        os.close(fd)
+        atexit.register(self._remove_3d_html)
 
-        # Initialize visualizer and statistics
+        # Show a progress bar while the simulation runs on a worker thread
+        self.setup_loading_ui()
+
+        print("Running simulation...")
+        self.simulation_thread = threading.Thread(target=self._run_simulation, daemon=True)
+        self.simulation_thread.start()
+        self.root.after(100, self._check_simulation)
+
+    def setup_loading_ui(self):
+        """Setup the placeholder shown while the simulation runs"""
+        self.loading_frame = ttk.Frame(self.root)
+        self.loading_frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        ttk.Label(self.loading_frame, text="Running simulation...").pack(pady=20)
+        self.progress = ttk.Progressbar(self.loading_frame, mode='indeterminate', length=300)
+        self.progress.pack(pady=10)
+        self.progress.start(10)
+
+    def _run_simulation(self):
+        """Run the simulation (worker thread)"""
+        load_or_simulate(self.solar_system, time_span=365 * 2, n_steps=1000)  # 2 years
+
+    def _check_simulation(self):
+        """Poll the worker thread from the Tk event loop"""
+        if self.simulation_thread.is_alive():
+            self.root.after(100, self._check_simulation)
+        else:
+            self._on_simulation_done()
+
+    def _on_simulation_done(self):
+        """Build the real UI once simulation results are available"""
+        self.progress.stop()
+        self.loading_frame.destroy()
+
+        # Initialize visualizer and statistics (pandas/scipy load only now)
+        from statistics import SolarSystemStatistics
         self.visualizer = SolarSystemVisualizer(self.solar_system)
         self.statistics = SolarSystemStatistics(self.solar_system)
 
@@ -100,14 +155,13 @@ class SolarSystemApp:
 
     def refresh_plot(self):
         """Refresh the solar system plot"""
-        self.fig, self.ax = self.visualizer.create_static_plot()
-        plt.show()
+        self.fig, self.ax = self.visualizer.update_static_plot()
 
     def create_animation(self):
         """Create and save animation"""
         print("Creating animation...")
-        self.visualizer.create_animation(save_path='solar_system_animation.gif')
-        print("Animation saved as 'solar_system_animation.gif'")
+        self.visualizer.create_animation(save_path='solar_system_animation.mp4')
+        print(f"Animation saved as '{self.visualizer.animation_path}'")
 
     def show_energy_analysis(self):
         """Show orbital energy analysis"""
@@ -121,53 +175,74 @@ class SolarSystemApp:
 
     def open_3d_visualization(self):
         """Open 3D visualization in browser"""
+        # Building and serializing the Plotly figure never touches Tk, so it
+        # can run off the GUI thread
+        threading.Thread(target=self._build_and_show_3d, daemon=True).start()
+
+    def _build_and_show_3d(self):
+        """Write the 3D visualization to the app's HTML file and open it (worker thread)"""
         fig = self.visualizer.create_3d_plotly_visualization()
-        fig.show()
+
+        fig.write_html(self.plot_3d_path)
+        webbrowser.open_new_tab('file://' + self.plot_3d_path)
+
+    def _remove_3d_html(self):
+        """Delete the 3D visualization file (atexit)"""
+        try:
+            os.remove(self.plot_3d_path)
+        except FileNotFoundError:
+            pass
 
 
 def main():
-    # Option 1: Run with GUI
+    # Option 1: Run without GUI (python main.py --headless, or no display)
+    if HEADLESS:
+        run_demo()
+        return
+
+    # Option 2: Run with GUI
     root = tk.Tk()
     app = SolarSystemApp(root)
     root.mainloop()
 
-    # Option 2: Run without GUI (uncomment below)
-    # run_demo()
-
 
 def run_demo():
-    """Run a demonstration without GUI"""
+    """Run a demonstration without GUI
+
+    Every figure is laid out with tight_layout when it is built, so the
+    saves skip bbox_inches='tight' and its extra render pass.
+    """
     print("Initializing Solar System...")
     solar_system = SolarSystem()
 
     print("Running simulation...")
-    solar_system.simulate(time_span=365 * 2, n_steps=1000)
+    load_or_simulate(solar_system, time_span=365 * 2, n_steps=1000)
 
     print("Creating visualizations...")
     visualizer = SolarSystemVisualizer(solar_system)
 
     # Create static plots
     fig, ax = visualizer.create_static_plot()
-    plt.savefig('solar_system_static.png', dpi=300, bbox_inches='tight')
+    plt.savefig('solar_system_static.png', dpi=DPI)
 
     # Create comparison plots
     fig2 = visualizer.create_comparison_plots()
-    plt.savefig('planetary_comparison.png', dpi=300, bbox_inches='tight')
+    plt.savefig('planetary_comparison.png', dpi=DPI)
 
     # Create 3D visualization
     fig3 = visualizer.create_3d_plotly_visualization()
     fig3.write_html('solar_system_3d.html')
 
     # Generate statistics
+    from statistics import SolarSystemStatistics
     stats = SolarSystemStatistics(solar_system)
     stats.keplers_law_verification()
-    plt.savefig('keplers_law.png', dpi=300, bbox_inches='tight')
+    plt.savefig('keplers_law.png', dpi=DPI)
 
     stats.orbital_energy_analysis()
-    plt.savefig('orbital_energy.png', dpi=300, bbox_inches='tight')
+    plt.savefig('orbital_energy.png', dpi=DPI)
 
     print("All visualizations saved!")
-    plt.show()
 
 
 if __name__ == "__main__":
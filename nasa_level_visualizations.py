@@ -9,14 +9,33 @@ import matplotlib.pyplot as plt
 from matplotlib.patches import Ellipse, Circle, Wedge
 import matplotlib.colors as mcolors
 from matplotlib.collections import PatchCollection
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.express as px
-from scipy.interpolate import griddata
-import pandas as pd
 from solar_system import SolarSystem
+import kernels
 from data.constants import AU, G, SOLAR_MASS
-import json
+from data._loader import load_planet_data_cached
+from parallel_render import render_tiles
+
+
+DASHBOARD_SIZE = (28, 18)
+DASHBOARD_TITLE = '🔬 NASA-GRADE SOLAR SYSTEM SCIENCE DASHBOARD 🔬'
+
+# Science dashboard layout on a 4 x 6 grid: (panel method, row, first column, last column + 1)
+DASHBOARD_PANELS = (
+    # Row 1: Orbital Mechanics
+    ('_plot_precision_orbits', 0, 0, 2),
+    ('_plot_orbital_parameters', 0, 2, 4),
+    ('_plot_velocity_profile', 0, 4, 6),
+    # Row 2: Physical Properties
+    ('_plot_density_comparison', 1, 0, 2),
+    ('_plot_gravity_comparison', 1, 2, 4),
+    ('_plot_escape_velocity', 1, 4, 6),
+    # Row 3: Atmospheric Science
+    ('_plot_atmospheric_composition', 2, 0, 3),
+    ('_plot_albedo_comparison', 2, 3, 6),
+    # Row 4: System Dynamics
+    ('_plot_orbital_resonances', 3, 0, 3),
+    ('_plot_temperature_profile', 3, 3, 6),
+)
 
 
 class NASAVisualizer:
@@ -52,6 +71,9 @@ class NASAVisualizer:
             'sun': '#FFD700'
         }
 
+        # Surface colors aligned with planet_order, for the per-planet panels
+        self.surface_colors_ordered = [self.get_planet_color(p, 'surface') for p in self.planet_order]
+
         # Space background gradients
         self.space_gradients = {
             'deep_space': ['#000033', '#0B0B3B', '#1A1A4B'],
@@ -61,8 +83,7 @@ class NASAVisualizer:
 
     def load_nasa_grade_data(self):
         """Load comprehensive NASA-grade planetary data"""
-        with open('data/planet_data.json', 'r') as f:
-            self.planet_data = json.load(f)
+        self.planet_data = load_planet_data_cached()
 
         # Enhanced orbital elements (NASA JPL data)
         self.orbital_elements = {
@@ -100,103 +121,159 @@ class NASAVisualizer:
             'neptune': {'H2': 80, 'He': 19, 'CH4': 1}
         }
 
-    def get_planet_color(self, planet_name, color_type='surface'):
-        """Safe method to get planet colors"""
-        try:
-            return self.nasa_colors[planet_name][color_type]
-        except KeyError:
-            return self.planet_base_colors.get(planet_name, '#FFFFFF')
+        # Every gas listed above, in sorted order
+        self._atm_gases = ('Ar', 'CH4', 'CO2', 'H2', 'He', 'N2', 'Na', 'O2')
 
-    def create_science_dashboard(self):
-        """Comprehensive scientific dashboard with multiple analysis panels"""
-        fig = plt.figure(figsize=(28, 18))
-        fig.patch.set_facecolor('#000033')
+        # Per-planet arrays in a fixed planet order, so the plot routines
+        # read contiguous columns instead of walking the dicts above
+        self.planet_order = list(self.orbital_elements)
+        self.planet_names = [self.planet_data[p]['name'] for p in self.planet_order]
 
-        # Complex grid layout for professional appearance
-        gs = plt.GridSpec(4, 6, figure=fig, hspace=0.5, wspace=0.4)
+        def column(table, key):
+            return np.array([table[p][key] for p in self.planet_order], dtype=np.float64)
+
+        self.oe_a = column(self.orbital_elements, 'a')
+        self.oe_e = column(self.orbital_elements, 'e')
+        self.oe_i = column(self.orbital_elements, 'i')
+        self.oe_w = column(self.orbital_elements, 'ω')
+        self.oe_W = column(self.orbital_elements, 'Ω')
+
+        self.pd_density = column(self.physical_data, 'density')
+        self.pd_gravity = column(self.physical_data, 'gravity')
+        self.pd_escape_velocity = column(self.physical_data, 'escape_velocity')
+        self.pd_albedo = column(self.physical_data, 'albedo')
+        self.pd_orbital_period = column(self.planet_data, 'orbital_period')
 
-        # Row 1: Orbital Mechanics
-        ax1 = fig.add_subplot(gs[0, 0:2])  # Realistic orbits
-        self._plot_precision_orbits(ax1)
+        # Atmospheric percentages, shape (n_planets, n_gases)
+        self._atm_matrix = np.array([[self.atmospheres[p].get(g, 0) for g in self._atm_gases]
+                                     for p in self.planet_order], dtype=np.float64)
+
+        # Derived quantities depend only on the constant data above
+        self.orbital_velocities_kms = np.sqrt(G * SOLAR_MASS / (self.oe_a * AU)) / 1000.0
+        # Simplified blackbody temperature calculation, in Celsius
+        self.blackbody_temps_c = 279 * (1 - self.pd_albedo) ** 0.25 / np.sqrt(self.oe_a) - 273.15
+
+    def get_planet_color(self, planet_name, color_type='surface'):
+        """Safe method to get planet colors"""
+        colors = self.nasa_colors.get(planet_name)
+        return (colors.get(color_type) if colors else None) or \
+            self.planet_base_colors.get(planet_name, '#FFFFFF')
 
-        ax2 = fig.add_subplot(gs[0, 2:4])  # Orbital parameters
-        self._plot_orbital_parameters(ax2)
+    def _label_bars(self, ax, bars, values, fmt='{:.2f}', **kwargs):
+        """Write each value above its bar in one bar_label call"""
+        kwargs.setdefault('fontsize', 8)
+        ax.bar_label(bars, labels=[fmt.format(v) for v in values],
+                     color='white', padding=2, **kwargs)
 
-        ax3 = fig.add_subplot(gs[0, 4:6])  # Velocity profile
-        self._plot_velocity_profile(ax3)
+    def _styled_bar(self, ax, values, ylabel, title, value_fmt='{:.2f}', reflines=(), label_size=8):
+        """One labelled bar per planet in the dashboard's dark style.
 
-        # Row 2: Physical Properties
-        ax4 = fig.add_subplot(gs[1, 0:2])  # Density comparison
-        self._plot_density_comparison(ax4)
+        reflines is a sequence of (y, color, label) dashed reference lines;
+        a legend is added when any are given.
+        """
+        x_pos = np.arange(len(self.planet_names))
+        bars = ax.bar(x_pos, values, color=self.surface_colors_ordered, alpha=0.8, edgecolor='white')
 
-        ax5 = fig.add_subplot(gs[1, 2:4])  # Gravity field
-        self._plot_gravity_comparison(ax5)
+        for y, color, label in reflines:
+            ax.axhline(y=y, color=color, linestyle='--', alpha=0.7, label=label)
 
-        ax6 = fig.add_subplot(gs[1, 4:6])  # Escape velocity
-        self._plot_escape_velocity(ax6)
+        self._label_bars(ax, bars, values, value_fmt, fontsize=label_size)
 
-        # Row 3: Atmospheric Science
-        ax7 = fig.add_subplot(gs[2, 0:3])  # Atmospheric composition
-        self._plot_atmospheric_composition(ax7)
+        ax.set_facecolor('#000033')
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(self.planet_names, rotation=45)
+        ax.tick_params(colors='white')
+        ax.set_ylabel(ylabel, color='white')
+        ax.set_title(title, color='white', fontsize=14, fontweight='bold')
+        if reflines:
+            ax.legend(facecolor='#1A1A4B', edgecolor='white', labelcolor='white')
+        ax.grid(True, alpha=0.2, color='white', axis='y')
 
-        ax8 = fig.add_subplot(gs[2, 3:6])  # Albedo comparison
-        self._plot_albedo_comparison(ax8)
+    def create_science_dashboard(self):
+        """Comprehensive scientific dashboard with multiple analysis panels"""
+        fig = plt.figure(figsize=DASHBOARD_SIZE)
+        fig.patch.set_facecolor('#000033')
 
-        # Row 4: System Dynamics
-        ax9 = fig.add_subplot(gs[3, 0:3])  # Orbital resonances
-        self._plot_orbital_resonances(ax9)
+        # Complex grid layout for professional appearance
+        gs = plt.GridSpec(4, 6, figure=fig, hspace=0.5, wspace=0.4)
 
-        ax10 = fig.add_subplot(gs[3, 3:6])  # Temperature profile
-        self._plot_temperature_profile(ax10)
+        for method_name, row, first_col, last_col in DASHBOARD_PANELS:
+            ax = fig.add_subplot(gs[row, first_col:last_col])
+            getattr(self, method_name)(ax)
 
-        plt.suptitle('🔬 NASA-GRADE SOLAR SYSTEM SCIENCE DASHBOARD 🔬',
-                     fontsize=26, fontweight='bold', color='white', y=0.98)
+        # Plain figure text, so no suptitle layout pass over the ten axes
+        fig.text(0.5, 0.985, DASHBOARD_TITLE, fontsize=26, fontweight='bold', color='white',
+                 ha='center', va='top')
 
         return fig
 
-    def _plot_precision_orbits(self, ax):
-        """High-precision orbital mechanics visualization"""
+    def save_science_dashboard_parallel(self, path, dpi=300, max_workers=None):
+        """Render the dashboard panels in worker processes and tile them into one PNG.
+
+        Each panel is drawn on its own figure the size of its grid cell,
+        so the panels can render on separate cores; the tiles are then
+        pasted into a single image below the title band.
+        The workers are spawned, so this cannot be called from an
+        interactive session, and a calling script must keep its entry
+        point under an `if __name__ == '__main__':` guard.
+        """
+        render_tiles(path, _render_tile, DASHBOARD_PANELS, DASHBOARD_SIZE, (4, 6), dpi, max_workers)
+
+    def _plot_precision_orbits(self, ax, equal_time=False):
+        """High-precision orbital mechanics visualization.
+
+        With equal_time=True each orbit is sampled at equal steps of mean
+        anomaly (equal time intervals) rather than equal angles, so the
+        samples bunch up near aphelion as the planet slows down.
+        """
         ax.set_facecolor('#000033')
+        # Anything below zorder 0 (the starfield) is flattened to a bitmap on save
+        ax.set_rasterization_zorder(0)
         self._create_realistic_starfield(ax, 500)
 
-        # Plot sun with scientific accuracy
+        # Plot sun with scientific accuracy, plus a corona effect, as one collection
         sun_radius = 0.00465  # AU scale
         sun_disk = Circle((0, 0), sun_radius, color=self.get_planet_color('sun', 'surface'), alpha=0.9)
-        ax.add_patch(sun_disk)
-
-        # Corona effect
         corona = Circle((0, 0), sun_radius * 1.5, color=self.get_planet_color('sun', 'corona'), alpha=0.3)
-        ax.add_patch(corona)
+        ax.add_collection(PatchCollection([sun_disk, corona], match_original=True))
 
-        for planet_name, elements in self.orbital_elements.items():
-            planet_data = self.planet_data[planet_name]
-            a = elements['a']  # Semi-major axis in AU
-            e = elements['e']  # Eccentricity
-            i = np.radians(elements['i'])  # Inclination
-            ω = np.radians(elements['ω'])  # Argument of perihelion
-            Ω = np.radians(elements['Ω'])  # Longitude of ascending node
+        inclinations = np.radians(self.oe_i)
+        perihelion_args = np.radians(self.oe_w)
+        ascending_nodes = np.radians(self.oe_W)
 
-            # Generate precise elliptical orbit using Keplerian elements
-            theta = np.linspace(0, 2 * np.pi, 500)
-            r = a * (1 - e ** 2) / (1 + e * np.cos(theta - ω))
+        # One angle grid shared by every orbit
+        theta = np.linspace(0, 2 * np.pi, 500)
+        cos_t = np.cos(theta)
+        sin_t = np.sin(theta)
+
+        # Perihelion and aphelion points, drawn together after the loop
+        perihelia = np.empty((len(self.planet_order), 2))
+        aphelia = np.empty((len(self.planet_order), 2))
+
+        for k, planet_name in enumerate(self.planet_order):
+            if equal_time:
+                cos_t, sin_t = self._equal_time_angles(self.oe_e[k], perihelion_args[k], theta)
 
-            # Convert to Cartesian coordinates with proper orientation
-            x = r * (np.cos(theta + Ω) * np.cos(ω) - np.sin(theta + Ω) * np.sin(ω) * np.cos(i))
-            y = r * (np.sin(theta + Ω) * np.cos(ω) + np.cos(theta + Ω) * np.sin(ω) * np.cos(i))
+            # Generate precise elliptical orbit using Keplerian elements
+            x, y, z = kernels.kepler_xyz(self.oe_a[k], self.oe_e[k], inclinations[k],
+                                         perihelion_args[k], ascending_nodes[k], cos_t, sin_t)
+            r2 = x * x + y * y + z * z
 
             # Plot orbit with scientific color coding
-            color = self.get_planet_color(planet_name, 'surface')
+            color = self.surface_colors_ordered[k]
             ax.plot(x, y, color=color, linewidth=1.5, alpha=0.8,
-                    label=f"{planet_data['name']}")
+                    label=self.planet_names[k], rasterized=True)
 
             # Mark perihelion and aphelion
-            perihelion_idx = np.argmin(r)
-            aphelion_idx = np.argmax(r)
+            perihelion_idx = np.argmin(r2)
+            aphelion_idx = np.argmax(r2)
+            perihelia[k] = x[perihelion_idx], y[perihelion_idx]
+            aphelia[k] = x[aphelion_idx], y[aphelion_idx]
 
-            ax.scatter(x[perihelion_idx], y[perihelion_idx],
-                       color=color, s=30, marker='o', alpha=0.8)
-            ax.scatter(x[aphelion_idx], y[aphelion_idx],
-                       color=color, s=30, marker='s', alpha=0.8)
+        ax.scatter(perihelia[:, 0], perihelia[:, 1],
+                   color=self.surface_colors_ordered, s=30, marker='o', alpha=0.8)
+        ax.scatter(aphelia[:, 0], aphelia[:, 1],
+                   color=self.surface_colors_ordered, s=30, marker='s', alpha=0.8)
 
         ax.set_xlim(-35, 35)
         ax.set_ylim(-35, 35)
@@ -204,24 +281,25 @@ class NASAVisualizer:
         ax.legend(facecolor='#1A1A4B', edgecolor='white', labelcolor='white', fontsize=8)
         ax.grid(True, alpha=0.1, color='white')
 
+    @staticmethod
+    def _equal_time_angles(e, w, mean_anomaly):
+        """cos/sin of the argument of latitude at the given mean anomalies"""
+        E = kernels.kepler_E(mean_anomaly, e)
+        true_anomaly = 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2),
+                                      np.sqrt(1 - e) * np.cos(E / 2))
+        u = true_anomaly + w
+        return np.cos(u), np.sin(u)
+
     def _plot_orbital_parameters(self, ax):
         """Comparative analysis of orbital parameters"""
-        planets = []
-        eccentricities = []
-        inclinations = []
-        semi_major_axes = []
-        colors = []
-
-        for planet_name, elements in self.orbital_elements.items():
-            planets.append(self.planet_data[planet_name]['name'])
-            eccentricities.append(elements['e'])
-            inclinations.append(elements['i'])
-            semi_major_axes.append(elements['a'])
-            colors.append(self.get_planet_color(planet_name, 'surface'))
+        planets = self.planet_names
+        eccentricities = self.oe_e
+        inclinations = self.oe_i
+        colors = self.surface_colors_ordered
 
         # Create comparative scatter plot
         scatter = ax.scatter(eccentricities, inclinations,
-                             s=[a * 50 for a in semi_major_axes],  # Size by semi-major axis
+                             s=self.oe_a * 50,  # Size by semi-major axis
                              c=colors, alpha=0.8, edgecolors='white', linewidth=1)
 
         # Add planet labels
@@ -238,149 +316,46 @@ class NASAVisualizer:
 
     def _plot_velocity_profile(self, ax):
         """Orbital velocity analysis with scientific accuracy"""
-        planets = []
-        velocities = []
-        distances = []
-        colors = []
-
-        for planet_name, elements in self.orbital_elements.items():
-            planets.append(self.planet_data[planet_name]['name'])
-            a = elements['a'] * AU  # Convert to meters
-            v = np.sqrt(G * SOLAR_MASS / a) / 1000  # Orbital velocity in km/s
-            velocities.append(v)
-            distances.append(elements['a'])
-            colors.append(self.get_planet_color(planet_name, 'surface'))
-
-        # Create scientific velocity profile
-        x_pos = np.arange(len(planets))
-        bars = ax.bar(x_pos, velocities, color=colors, alpha=0.8, edgecolor='white')
-
-        # Add velocity values
-        for i, (bar, vel) in enumerate(zip(bars, velocities)):
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.5,
-                    f'{vel:.1f} km/s', ha='center', va='bottom', color='white', fontsize=9)
-
-        ax.set_facecolor('#000033')
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(planets, rotation=45, color='white')
-        ax.set_ylabel('Orbital Velocity (km/s)', color='white')
-        ax.set_title('🚀 KEPLERIAN VELOCITY PROFILE', color='white', fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.2, color='white', axis='y')
+        self._styled_bar(ax, self.orbital_velocities_kms, 'Orbital Velocity (km/s)',
+                         '🚀 KEPLERIAN VELOCITY PROFILE', '{:.1f} km/s', label_size=9)
 
     def _plot_density_comparison(self, ax):
         """Planetary density analysis with scientific context"""
-        planets = []
-        densities = []
-        colors = []
-
-        for planet_name, physical in self.physical_data.items():
-            planets.append(self.planet_data[planet_name]['name'])
-            densities.append(physical['density'])
-            colors.append(self.get_planet_color(planet_name, 'surface'))
-
-        # Create density comparison with reference lines
-        x_pos = np.arange(len(planets))
-        bars = ax.bar(x_pos, densities, color=colors, alpha=0.8, edgecolor='white')
-
-        # Add reference lines for water and iron
-        ax.axhline(y=1.0, color='cyan', linestyle='--', alpha=0.7, label='Water Density')
-        ax.axhline(y=7.87, color='red', linestyle='--', alpha=0.7, label='Iron Density')
-
-        # Add density values
-        for i, (bar, density) in enumerate(zip(bars, densities)):
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.1,
-                    f'{density:.2f} g/cm³', ha='center', va='bottom', color='white', fontsize=8)
-
-        ax.set_facecolor('#000033')
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(planets, rotation=45, color='white')
-        ax.set_ylabel('Density (g/cm³)', color='white')
-        ax.set_title('⚖️ PLANETARY DENSITY COMPARISON', color='white', fontsize=14, fontweight='bold')
-        ax.legend(facecolor='#1A1A4B', edgecolor='white', labelcolor='white')
-        ax.grid(True, alpha=0.2, color='white', axis='y')
+        # Reference lines for water and iron
+        self._styled_bar(ax, self.pd_density, 'Density (g/cm³)',
+                         '⚖️ PLANETARY DENSITY COMPARISON', '{:.2f} g/cm³',
+                         reflines=[(1.0, 'cyan', 'Water Density'), (7.87, 'red', 'Iron Density')])
 
     def _plot_gravity_comparison(self, ax):
         """Surface gravity analysis"""
-        planets = []
-        gravities = []
-        colors = []
-
-        for planet_name, physical in self.physical_data.items():
-            planets.append(self.planet_data[planet_name]['name'])
-            gravities.append(physical['gravity'])
-            colors.append(self.get_planet_color(planet_name, 'surface'))
-
-        # Create gravity comparison with Earth reference
+        # Gravity relative to Earth
         earth_gravity = 9.81
-        relative_gravities = [g / earth_gravity for g in gravities]
-
-        x_pos = np.arange(len(planets))
-        bars = ax.bar(x_pos, relative_gravities, color=colors, alpha=0.8, edgecolor='white')
-
-        ax.axhline(y=1.0, color='green', linestyle='--', alpha=0.7, label='Earth Gravity')
-
-        for i, (bar, rel_g) in enumerate(zip(bars, relative_gravities)):
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.02,
-                    f'{rel_g:.2f}×', ha='center', va='bottom', color='white', fontsize=8)
-
-        ax.set_facecolor('#000033')
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(planets, rotation=45, color='white')
-        ax.set_ylabel('Relative Surface Gravity (Earth = 1)', color='white')
-        ax.set_title('🌍 SURFACE GRAVITY COMPARISON', color='white', fontsize=14, fontweight='bold')
-        ax.legend(facecolor='#1A1A4B', edgecolor='white', labelcolor='white')
-        ax.grid(True, alpha=0.2, color='white', axis='y')
+        self._styled_bar(ax, self.pd_gravity / earth_gravity, 'Relative Surface Gravity (Earth = 1)',
+                         '🌍 SURFACE GRAVITY COMPARISON', '{:.2f}×',
+                         reflines=[(1.0, 'green', 'Earth Gravity')])
 
     def _plot_escape_velocity(self, ax):
         """Escape velocity analysis"""
-        planets = []
-        escape_velocities = []
-        colors = []
-
-        for planet_name, physical in self.physical_data.items():
-            planets.append(self.planet_data[planet_name]['name'])
-            escape_velocities.append(physical['escape_velocity'])
-            colors.append(self.get_planet_color(planet_name, 'surface'))
-
-        x_pos = np.arange(len(planets))
-        bars = ax.bar(x_pos, escape_velocities, color=colors, alpha=0.8, edgecolor='white')
-
-        for i, (bar, esc_vel) in enumerate(zip(bars, escape_velocities)):
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.2,
-                    f'{esc_vel:.1f} km/s', ha='center', va='bottom', color='white', fontsize=8)
-
-        ax.set_facecolor('#000033')
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(planets, rotation=45, color='white')
-        ax.set_ylabel('Escape Velocity (km/s)', color='white')
-        ax.set_title('🚀 ESCAPE VELOCITY ANALYSIS', color='white', fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.2, color='white', axis='y')
+        self._styled_bar(ax, self.pd_escape_velocity, 'Escape Velocity (km/s)',
+                         '🚀 ESCAPE VELOCITY ANALYSIS', '{:.1f} km/s')
 
     def _plot_atmospheric_composition(self, ax):
         """Detailed atmospheric composition analysis"""
-        planets = list(self.atmospheres.keys())
-        planet_names = [self.planet_data[p]['name'] for p in planets]
+        planet_names = self.planet_names
 
-        # Prepare stacked bar data
-        gases = set()
-        for composition in self.atmospheres.values():
-            gases.update(composition.keys())
-        gases = sorted(gases)
-
-        bottom = np.zeros(len(planets))
+        # Stacked bar data: each gas sits on the running total of the ones before it
+        gases = self._atm_gases
+        bottoms = np.cumsum(self._atm_matrix, axis=1) - self._atm_matrix
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FECA57', '#FF9FF3']
 
         for i, gas in enumerate(gases):
-            percentages = [self.atmospheres[planet].get(gas, 0) for planet in planets]
-            bars = ax.bar(planet_names, percentages, bottom=bottom,
+            percentages = self._atm_matrix[:, i]
+            bars = ax.bar(planet_names, percentages, bottom=bottoms[:, i],
                           label=gas, color=colors[i % len(colors)], alpha=0.8)
-            bottom += percentages
 
-            # Add percentage labels
-            for j, (bar, percentage) in enumerate(zip(bars, percentages)):
-                if percentage > 5:  # Only label significant percentages
-                    ax.text(bar.get_x() + bar.get_width() / 2, bar.get_y() + bar.get_height() / 2,
-                            f'{percentage:.1f}%', ha='center', va='center', color='white', fontsize=7)
+            # Add percentage labels, only for significant percentages
+            labels = [f'{p:.1f}%' if p > 5 else '' for p in percentages]
+            ax.bar_label(bars, labels=labels, label_type='center', color='white', fontsize=7)
 
         ax.set_facecolor('#000033')
         ax.set_ylabel('Atmospheric Composition (%)', color='white')
@@ -391,74 +366,20 @@ class NASAVisualizer:
 
     def _plot_albedo_comparison(self, ax):
         """Planetary albedo (reflectivity) analysis"""
-        planets = []
-        albedos = []
-        colors = []
-
-        for planet_name, physical in self.physical_data.items():
-            planets.append(self.planet_data[planet_name]['name'])
-            albedos.append(physical['albedo'])
-            colors.append(self.get_planet_color(planet_name, 'surface'))
-
-        # Create albedo comparison
-        x_pos = np.arange(len(planets))
-        bars = ax.bar(x_pos, albedos, color=colors, alpha=0.8, edgecolor='white')
-
-        for i, (bar, albedo) in enumerate(zip(bars, albedos)):
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.01,
-                    f'{albedo:.2f}', ha='center', va='bottom', color='white', fontsize=8)
-
-        ax.set_facecolor('#000033')
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(planets, rotation=45, color='white')
-        ax.set_ylabel('Bond Albedo', color='white')
-        ax.set_title('☀️ PLANETARY ALBEDO COMPARISON', color='white', fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.2, color='white', axis='y')
+        self._styled_bar(ax, self.pd_albedo, 'Bond Albedo', '☀️ PLANETARY ALBEDO COMPARISON')
 
     def _plot_orbital_resonances(self, ax):
         """Orbital resonance analysis"""
-        planets = list(self.orbital_elements.keys())
-        planet_names = [self.planet_data[p]['name'] for p in planets]
-        periods = [self.planet_data[p]['orbital_period'] for p in planets]
-
-        # Calculate resonance ratios with Jupiter (reference)
+        # Resonance ratios with Jupiter (reference)
         jupiter_period = self.planet_data['jupiter']['orbital_period']
-        resonances = [p / jupiter_period for p in periods]
-
-        colors = [self.get_planet_color(p, 'surface') for p in planets]
-
-        # Create resonance plot
-        x_pos = np.arange(len(planets))
-        bars = ax.bar(x_pos, resonances, color=colors, alpha=0.8, edgecolor='white')
-
-        ax.axhline(y=1.0, color='orange', linestyle='--', alpha=0.7, label='Jupiter Reference')
-
-        for i, (bar, resonance) in enumerate(zip(bars, resonances)):
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.1,
-                    f'{resonance:.2f}', ha='center', va='bottom', color='white', fontsize=8)
-
-        ax.set_facecolor('#000033')
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(planet_names, rotation=45, color='white')
-        ax.set_ylabel('Orbital Period Ratio (Jupiter = 1)', color='white')
-        ax.set_title('🔄 ORBITAL RESONANCE ANALYSIS', color='white', fontsize=14, fontweight='bold')
-        ax.legend(facecolor='#1A1A4B', edgecolor='white', labelcolor='white')
-        ax.grid(True, alpha=0.2, color='white', axis='y')
+        self._styled_bar(ax, self.pd_orbital_period / jupiter_period,
+                         'Orbital Period Ratio (Jupiter = 1)', '🔄 ORBITAL RESONANCE ANALYSIS',
+                         reflines=[(1.0, 'orange', 'Jupiter Reference')])
 
     def _plot_temperature_profile(self, ax):
         """Scientific temperature profile with blackbody calculations"""
-        distances = [elements['a'] for elements in self.orbital_elements.values()]
-        planets = [self.planet_data[p]['name'] for p in self.orbital_elements.keys()]
-
-        # Calculate theoretical blackbody temperatures
-        solar_constant = 1361  # W/m² at 1 AU
-        albedos = [self.physical_data[p]['albedo'] for p in self.orbital_elements.keys()]
-
-        blackbody_temps = []
-        for i, distance in enumerate(distances):
-            # Simplified blackbody temperature calculation
-            effective_temp = 279 * (1 - albedos[i]) ** 0.25 / np.sqrt(distance)
-            blackbody_temps.append(effective_temp - 273.15)  # Convert to Celsius
+        planets = self.planet_names
+        blackbody_temps = self.blackbody_temps_c
 
         # Actual average temperatures (Celsius)
         actual_temps = [167, 464, 15, -65, -110, -140, -195, -200]
@@ -479,82 +400,92 @@ class NASAVisualizer:
 
     def _create_realistic_starfield(self, ax, num_stars):
         """Create scientifically accurate starfield"""
-        # Generate stars with realistic magnitude distribution
-        magnitudes = np.random.exponential(1.0, num_stars)
-        sizes = 0.5 + magnitudes * 2
-        brightness = 0.1 + 0.9 * (1 - np.exp(-magnitudes))
+        # Seeded so the dashboard background is the same on every render
+        rng = np.random.default_rng(42)
 
-        x_stars = np.random.uniform(-40, 40, num_stars)
-        y_stars = np.random.uniform(-40, 40, num_stars)
+        # Generate stars with realistic magnitude distribution
+        magnitudes = rng.exponential(1.0, num_stars)
+        x_stars, y_stars = rng.uniform(-40, 40, (2, num_stars))
 
-        # Add some bright stars (larger, brighter)
-        bright_indices = np.random.choice(num_stars, num_stars // 10, replace=False)
-        sizes[bright_indices] *= 3
-        brightness[bright_indices] = 1.0
+        # Roughly one star in ten is bright (larger, brighter)
+        bright = rng.random(num_stars) < 0.1
+        sizes = (0.5 + magnitudes * 2) * np.where(bright, 3, 1)
+        brightness = np.where(bright, 1.0, 0.1 + 0.9 * (1 - np.exp(-magnitudes)))
 
-        ax.scatter(x_stars, y_stars, s=sizes, c='white', alpha=brightness, marker='.')
+        ax.scatter(x_stars, y_stars, s=sizes, c='white', alpha=brightness, marker='.',
+                   rasterized=True, zorder=-1)
 
     def create_interactive_3d_solar_system(self):
         """Create stunning interactive 3D visualization"""
+        import plotly.graph_objects as go
+
         fig = go.Figure()
 
         # Add realistic starfield
         star_x = np.random.uniform(-50, 50, 2000)
         star_y = np.random.uniform(-50, 50, 2000)
         star_z = np.random.uniform(-50, 50, 2000)
-        star_size = np.random.uniform(0.5, 3, 2000)
 
+        # A scalar marker size keeps Plotly from uploading a per-point size buffer
         fig.add_trace(go.Scatter3d(
             x=star_x, y=star_y, z=star_z,
             mode='markers',
-            marker=dict(size=star_size, color='white', opacity=0.6),
+            marker=dict(size=1.5, color='white', opacity=0.5),
             name='Starfield',
             showlegend=False
         ))
 
-        # Add planets with precise orbits
-        for planet_name, elements in self.orbital_elements.items():
-            a = elements['a']
-            e = elements['e']
-            i = np.radians(elements['i'])
-
-            # Generate precise elliptical orbit
-            theta = np.linspace(0, 2 * np.pi, 200)
-            r = a * (1 - e ** 2) / (1 + e * np.cos(theta))
-
-            # 3D coordinates with inclination
-            x = r * np.cos(theta)
-            y = r * np.sin(theta) * np.cos(i)
-            z = r * np.sin(theta) * np.sin(i)
-
-            # Add orbit trace
-            fig.add_trace(go.Scatter3d(
-                x=x, y=y, z=z,
-                mode='lines',
-                line=dict(color=self.get_planet_color(planet_name, 'surface'), width=3),
-                name=f"{self.planet_data[planet_name]['name']} Orbit",
-                showlegend=True
-            ))
-
-            # Add planet
-            planet_size = max(2, np.log(self.planet_data[planet_name]['radius'] / 1e7) * 6)
-            fig.add_trace(go.Scatter3d(
-                x=[x[0]], y=[y[0]], z=[z[0]],
-                mode='markers',
-                marker=dict(
-                    size=planet_size,
-                    color=self.get_planet_color(planet_name, 'surface'),
-                    line=dict(color='white', width=1)
-                ),
-                name=self.planet_data[planet_name]['name']
-            ))
-
-        # Add spectacular sun
+        # One angle grid shared by every orbit
+        theta = np.linspace(0, 2 * np.pi, 200)
+        cos_t = np.cos(theta)
+        sin_t = np.sin(theta)
+
+        # All orbits go into one NaN-separated line trace and all bodies into
+        # one marker trace; Plotly's WebGL setup cost grows with trace count
+        n_points = len(theta) + 1
+        orbit_xyz = np.full((3, len(self.planet_order) * n_points), np.nan)
+        orbit_colors = []
+        marker_xyz = [[0.0], [0.0], [0.0]]
+        marker_sizes = [15]
+        marker_colors = ['#FFD700']
+        marker_names = ['Sun']
+
+        for k, planet_name in enumerate(self.planet_order):
+            color = self.surface_colors_ordered[k]
+
+            # Generate precise elliptical orbit, inclined about the x axis
+            x, y, z = kernels.kepler_xyz(self.oe_a[k], self.oe_e[k], np.radians(self.oe_i[k]),
+                                         0.0, 0.0, cos_t, sin_t)
+            start = k * n_points
+            orbit_xyz[:, start:start + len(theta)] = x, y, z
+            orbit_colors.extend([color] * n_points)
+
+            # Planet marker at the start of its orbit
+            for axis, values in enumerate((x, y, z)):
+                marker_xyz[axis].append(values[0])
+            marker_sizes.append(max(2, np.log(self.planet_data[planet_name]['radius'] / 1e7) * 6))
+            marker_colors.append(color)
+            marker_names.append(self.planet_names[k])
+
         fig.add_trace(go.Scatter3d(
-            x=[0], y=[0], z=[0],
+            x=orbit_xyz[0], y=orbit_xyz[1], z=orbit_xyz[2],
+            mode='lines',
+            line=dict(color=orbit_colors, width=3),
+            name='Orbits',
+            hoverinfo='skip'
+        ))
+
+        fig.add_trace(go.Scatter3d(
+            x=marker_xyz[0], y=marker_xyz[1], z=marker_xyz[2],
             mode='markers',
-            marker=dict(size=15, color='#FFD700', opacity=0.9),
-            name='Sun'
+            marker=dict(
+                size=marker_sizes,
+                color=marker_colors,
+                line=dict(color='white', width=1)
+            ),
+            text=marker_names,
+            hoverinfo='text',
+            name='Sun & Planets'
         ))
 
         fig.update_layout(
@@ -577,6 +508,27 @@ class NASAVisualizer:
         return fig
 
 
+def _render_tile(method_name, width, height, dpi):
+    """Draw one dashboard panel, or the title when method_name is None, and return its RGBA pixels"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=(width, height), dpi=dpi, facecolor='#000033')
+    FigureCanvasAgg(fig)
+
+    if method_name is None:
+        fig.text(0.5, 0.5, DASHBOARD_TITLE, fontsize=26, fontweight='bold', color='white',
+                 ha='center', va='center')
+    else:
+        # The panels only read the static NASA data, not the simulation
+        ax = fig.add_subplot()
+        getattr(NASAVisualizer(None), method_name)(ax)
+        fig.tight_layout()
+
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+
 def main():
     print("🔬 CREATING NASA-GRADE SOLAR SYSTEM VISUALIZATIONS...")
     print("📊 This will generate professional scientific dashboards! 📊")
@@ -589,9 +541,7 @@ def main():
     nasa_viz = NASAVisualizer(solar_system)
 
     print("1. 🛰️ Creating Comprehensive Science Dashboard...")
-    fig1 = nasa_viz.create_science_dashboard()
-    plt.savefig('NASA_GRADE_SCIENCE_DASHBOARD.png', dpi=300, bbox_inches='tight',
-                facecolor='#000033', edgecolor='none')
+    nasa_viz.save_science_dashboard_parallel('NASA_GRADE_SCIENCE_DASHBOARD.png', dpi=300)
 
     print("2. 🌌 Creating Interactive 3D Visualization...")
     fig2 = nasa_viz.create_interactive_3d_solar_system()
@@ -612,8 +562,6 @@ def main():
     print("   ✅ Professional scientific color coding")
     print("   ✅ Interactive 3D visualization with realistic orbits")
 
-    plt.show()
-
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""
+Render dashboard panels in worker processes and tile them into one PNG
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def render_tiles(path, render_tile, panels, size, grid, dpi, max_workers=None,
+                 title_height=1.0, facecolor='#000033'):
+    """Render every panel on its own core and paste the tiles into one image.
+
+    render_tile(panel, width, height, dpi) draws one panel, or the title
+    band when panel is None, and returns its RGBA pixels; it must be a
+    module-level function so the workers can unpickle it. panels holds
+    (panel, row, first column, last column + 1) entries on a grid of
+    (rows, columns) cells filling size (inches) below the title band.
+
+    max_workers defaults to the number of CPUs; with one, the tiles are
+    drawn in this process. Otherwise workers are spawned rather than
+    forked, because forking after Numba has set up its parallel kernels
+    leaves this process hanging at exit. Spawned workers re-import the
+    calling script, so it must keep its entry point under an
+    `if __name__ == '__main__':` guard.
+    """
+    from PIL import Image
+
+    width, height = size
+    rows, columns = grid
+    cell_width = width / columns
+    cell_height = (height - title_height) / rows
+
+    canvas = Image.new('RGBA', (round(width * dpi), round(height * dpi)), facecolor)
+    title = render_tile(None, width, title_height, dpi)
+    canvas.paste(Image.fromarray(title), (0, 0))
+
+    def paste(row, first_col, pixels):
+        offset = (round(first_col * cell_width * dpi),
+                  round((title_height + row * cell_height) * dpi))
+        canvas.paste(Image.fromarray(pixels), offset)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers == 1:
+        # A pool would only add start-up cost on a single core
+        for panel, row, first_col, last_col in panels:
+            paste(row, first_col,
+                  render_tile(panel, cell_width * (last_col - first_col), cell_height, dpi))
+    else:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers, mp_context=context) as pool:
+            tiles = [(row, first_col,
+                      pool.submit(render_tile, panel,
+                                  cell_width * (last_col - first_col), cell_height, dpi))
+                     for panel, row, first_col, last_col in panels]
+
+            for row, first_col, tile in tiles:
+                paste(row, first_col, tile.result())
+
+    canvas.save(path, compress_level=1)
@@ -3,13 +3,33 @@
 Enhanced realistic solar system visualizations
 """
 
+import sys
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
-from matplotlib.patches import Ellipse
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.lines import Line2D
 import plotly.graph_objects as go
 from solar_system import SolarSystem
 from data.constants import AU
-import json
+from data._loader import load_planet_data_cached
+
+
+def _angle_grid(n):
+    """cos and sin of n angles spanning one full turn"""
+    theta = np.linspace(0, 2 * np.pi, n)
+    return np.cos(theta), np.sin(theta)
+
+
+# Trig tables for drawing orbits, computed once at import: 100 points for
+# eccentric orbits, 64 for near-circular ones that look the same with fewer
+_COS_T, _SIN_T = _angle_grid(100)
+_COS_T_COARSE, _SIN_T_COARSE = _angle_grid(64)
+
+def _marker_handle(color, size, label):
+    """Legend stand-in for one point of a batched scatter with marker area `size`"""
+    return Line2D([], [], linestyle='', marker='o', markersize=np.sqrt(size),
+                  markerfacecolor=color, markeredgecolor='black', label=label)
 
 
 class RealisticSolarSystemVisualizer:
@@ -19,8 +39,7 @@ class RealisticSolarSystemVisualizer:
 
     def load_real_orbital_elements(self):
         """Load more realistic orbital elements including inclinations"""
-        with open('data/planet_data.json', 'r') as f:
-            self.planet_data = json.load(f)
+        self.planet_data = load_planet_data_cached()
 
     def create_realistic_2d_plot(self):
         """Create 2D plot with realistic elliptical orbits"""
@@ -47,32 +66,32 @@ class RealisticSolarSystemVisualizer:
 
         # Plot sun
         sun_data = self.planet_data['sun']
-        ax.scatter(0, 0, color=sun_data['color'], s=200, label='Sun', zorder=10)
-
-        for planet_name in inner_planets:
-            planet_data = self.planet_data[planet_name]
-            a = planet_data['semi_major_axis'] / AU  # Semi-major axis in AU
-            e = planet_data['eccentricity']  # Eccentricity
-
-            # Calculate ellipse parameters
-            b = a * np.sqrt(1 - e ** 2)  # Semi-minor axis
-            width = 2 * a
-            height = 2 * b
-
-            # Create ellipse patch
-            ellipse = Ellipse(xy=(0, 0), width=width, height=height,
-                              angle=0, fill=False,
-                              edgecolor=planet_data['color'],
-                              linewidth=2, alpha=0.7,
-                              label=f"{planet_data['name']} orbit")
-            ax.add_patch(ellipse)
-
-            # Plot current position (simplified - at perihelion)
-            current_x = a * (1 - e)
-            ax.scatter(current_x, 0, color=planet_data['color'], s=50,
-                       label=planet_data['name'], edgecolors='black')
-
-        ax.legend()
+        handles = [ax.scatter(0, 0, color=sun_data['color'], s=200, label='Sun', zorder=10)]
+
+        planets = [self.planet_data[p] for p in inner_planets]
+        a = np.array([p['semi_major_axis'] for p in planets]) / AU  # Semi-major axis in AU
+        e = np.array([p['eccentricity'] for p in planets])  # Eccentricity
+        b = a * np.sqrt(1 - e ** 2)  # Semi-minor axis
+        colors = [p['color'] for p in planets]
+
+        # All orbit ellipses in one collection, centred on the sun
+        orbits = EllipseCollection(widths=2 * a, heights=2 * b, angles=0, units='xy',
+                                   offsets=np.zeros((len(planets), 2)),
+                                   offset_transform=ax.transData,
+                                   facecolors='none', edgecolors=colors,
+                                   linewidths=2, alpha=0.7)
+        ax.add_collection(orbits)
+
+        # Plot current positions (simplified - at perihelion) in one scatter
+        ax.scatter(a * (1 - e), np.zeros(len(planets)), color=colors, s=50, edgecolors='black')
+
+        # Legend entries standing in for each planet's ellipse and marker
+        for k, planet_data in enumerate(planets):
+            handles.append(Line2D([], [], color=colors[k], linewidth=2, alpha=0.7,
+                                  label=f"{planet_data['name']} orbit"))
+            handles.append(_marker_handle(colors[k], 50, planet_data['name']))
+
+        ax.legend(handles=handles)
         ax.set_xlim(-1.5, 1.5)
         ax.set_ylim(-1.5, 1.5)
 
@@ -85,28 +104,30 @@ class RealisticSolarSystemVisualizer:
 
         # Plot sun
         sun_data = self.planet_data['sun']
-        ax.scatter(1, 1, color=sun_data['color'], s=300, label='Sun', zorder=10)
+        handles = [ax.scatter(1, 1, color=sun_data['color'], s=300, label='Sun', zorder=10)]
 
-        for planet_name, planet_data in self.planet_data.items():
-            if planet_data['type'] == 'planet':
-                a = planet_data['semi_major_axis'] / AU  # Semi-major axis in AU
-                e = planet_data['eccentricity']
+        planets = [data for data in self.planet_data.values() if data['type'] == 'planet']
+        colors = [data['color'] for data in planets]
+
+        # Use logarithmic scale for better visualization
+        a = np.array([data['semi_major_axis'] for data in planets]) / AU  # Semi-major axis in AU
+        log_a = np.log10(a + 1)
 
-                # Use logarithmic scale for better visualization
-                log_a = np.log10(a + 1)
+        # Plot orbits as circles (simplified for log scale), all in one collection
+        circle = np.column_stack((_COS_T_COARSE, _SIN_T_COARSE))
+        segments = log_a[:, None, None] * (1 + 0.1 * circle[None, :, :])
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=2, alpha=0.6))
 
-                # Plot orbit as circle (simplified for log scale)
-                orbit_circle = plt.Circle((log_a, log_a), log_a * 0.1,
-                                          fill=False, edgecolor=planet_data['color'],
-                                          linewidth=2, alpha=0.6,
-                                          label=f"{planet_data['name']} orbit")
-                ax.add_patch(orbit_circle)
+        # Plot planet positions
+        ax.scatter(log_a, log_a, color=colors, s=100, edgecolors='black')
 
-                # Plot planet position
-                ax.scatter(log_a, log_a, color=planet_data['color'], s=100,
-                           label=planet_data['name'], edgecolors='black')
+        # Legend stand-ins for each orbit and marker, in planet order
+        for data in planets:
+            handles.append(Line2D([], [], color=data['color'], linewidth=2, alpha=0.6,
+                                  label=f"{data['name']} orbit"))
+            handles.append(_marker_handle(data['color'], 100, data['name']))
 
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+        ax.legend(handles=handles, bbox_to_anchor=(1.05, 1), loc='upper left')
         ax.set_xlim(0, 2)
         ax.set_ylim(0, 2)
 
@@ -171,7 +192,11 @@ class RealisticSolarSystemVisualizer:
                     f'{size:,.0f} km', ha='center', va='bottom', fontsize=8)
 
     def create_3d_realistic_orbits(self):
-        """Create 3D plot with realistic orbital inclinations"""
+        """Create 3D plot with realistic orbital inclinations
+
+        Scatter3d already renders through WebGL; any 2D Plotly view added
+        to this class should likewise use go.Scattergl, not go.Scatter.
+        """
         fig = go.Figure()
 
         # Add realistic orbits with inclinations
@@ -180,40 +205,68 @@ class RealisticSolarSystemVisualizer:
             'jupiter': 1.3, 'saturn': 2.5, 'uranus': 0.8, 'neptune': 1.8
         }
 
-        for planet_name, planet_data in self.planet_data.items():
-            if planet_data['type'] == 'planet':
-                a = planet_data['semi_major_axis'] / AU
-                e = planet_data['eccentricity']
-                inclination = np.radians(inclinations.get(planet_name, 0))
-
-                # Generate elliptical orbit points
-                theta = np.linspace(0, 2 * np.pi, 100)
-                r = a * (1 - e ** 2) / (1 + e * np.cos(theta))
-
-                # Convert to 3D coordinates with inclination
-                x = r * np.cos(theta)
-                y = r * np.sin(theta) * np.cos(inclination)
-                z = r * np.sin(theta) * np.sin(inclination)
-
-                # Add orbit trace
-                fig.add_trace(go.Scatter3d(
-                    x=x, y=y, z=z,
-                    mode='lines',
-                    line=dict(color=planet_data['color'], width=3),
-                    name=f"{planet_data['name']} Orbit"
-                ))
-
-                # Add planet
-                fig.add_trace(go.Scatter3d(
-                    x=[x[0]], y=[y[0]], z=[z[0]],
-                    mode='markers',
-                    marker=dict(
-                        size=8,
-                        color=planet_data['color'],
-                        line=dict(color='black', width=1)
-                    ),
-                    name=planet_data['name']
-                ))
+        planets = [(name, data) for name, data in self.planet_data.items()
+                   if data['type'] == 'planet']
+        a = np.array([data['semi_major_axis'] for _, data in planets]) / AU
+        e = np.array([data['eccentricity'] for _, data in planets])
+        inclination = np.radians([inclinations.get(name, 0) for name, _ in planets])
+
+        # Generate elliptical orbit points for all planets sharing a grid
+        # size at once; near-circular orbits look the same with fewer vertices
+        near_circular = e < 0.1
+        orbits = [None] * len(planets)
+        for coarse, cos_t, sin_t in ((True, _COS_T_COARSE, _SIN_T_COARSE),
+                                     (False, _COS_T, _SIN_T)):
+            group = np.flatnonzero(near_circular == coarse)
+            r = (a[group] * (1 - e[group] ** 2))[:, None] / (1 + e[group][:, None] * cos_t)
+
+            # Convert to 3D coordinates with inclination
+            x = r * cos_t
+            y = r * sin_t * np.cos(inclination[group])[:, None]
+            z = r * sin_t * np.sin(inclination[group])[:, None]
+            for row, k in enumerate(group):
+                orbits[k] = x[row], y[row], z[row]
+
+        # All orbits go into one line trace, with a NaN point after each
+        # orbit so Plotly breaks the line between planets
+        gap = np.full((1, 3), np.nan)
+        path = np.concatenate([np.vstack((np.column_stack(orbit), gap)) for orbit in orbits])
+
+        # Per-point colour and hover label, repeated over each orbit's points
+        counts = [len(x) + 1 for x, _, _ in orbits]
+        orbit_colors = np.repeat([data['color'] for _, data in planets], counts).tolist()
+        orbit_names = np.repeat([f"{data['name']} Orbit" for _, data in planets], counts).tolist()
+
+        # Add orbit trace
+        fig.add_trace(go.Scatter3d(
+            x=path[:, 0], y=path[:, 1], z=path[:, 2],
+            mode='lines',
+            line=dict(color=orbit_colors, width=3),
+            text=orbit_names,
+            hoverinfo='text',
+            name='Orbits'
+        ))
+
+        # Every orbit starts at perihelion on the x axis
+        marker_x = a * (1 - e)
+        marker_y = np.zeros(len(planets))
+        marker_z = np.zeros(len(planets))
+        marker_colors = [data['color'] for _, data in planets]
+        marker_names = [data['name'] for _, data in planets]
+
+        # Add planets
+        fig.add_trace(go.Scatter3d(
+            x=marker_x, y=marker_y, z=marker_z,
+            mode='markers',
+            marker=dict(
+                size=8,
+                color=marker_colors,
+                line=dict(color='black', width=1)
+            ),
+            text=marker_names,
+            hoverinfo='text',
+            name='Planets'
+        ))
 
         # Add sun
         fig.add_trace(go.Scatter3d(
@@ -242,34 +295,46 @@ class RealisticSolarSystemVisualizer:
         return fig
 
 
+# Screen resolution; the figures are laid out with tight_layout when they
+# are built, so the saves skip bbox_inches='tight' and its extra render pass
+DPI = 150
+
+
 def main():
+    # Only --interactive opens windows; plain PNG export needs no GUI canvas
+    interactive = '--interactive' in sys.argv
+    if not interactive:
+        matplotlib.use('Agg')
+
     print("🪐 Creating Realistic Solar System Visualizations...")
 
-    # Create solar system and run simulation
+    # The realistic plots work from the orbital elements alone, so no
+    # simulation is needed for them
     solar_system = SolarSystem()
-    solar_system.simulate(time_span=365, n_steps=500)
 
     # Create realistic visualizer
     realistic_viz = RealisticSolarSystemVisualizer(solar_system)
 
     print("1. Creating realistic 2D orbits...")
     fig1, axes = realistic_viz.create_realistic_2d_plot()
-    plt.savefig('realistic_orbits_2d.png', dpi=300, bbox_inches='tight')
+    plt.savefig('realistic_orbits_2d.png', dpi=DPI)
 
     print("2. Creating scale comparison plots...")
     fig2 = realistic_viz.create_scale_comparison_plot()
-    plt.savefig('realistic_scales.png', dpi=300, bbox_inches='tight')
+    plt.savefig('realistic_scales.png', dpi=DPI)
 
     print("3. Creating 3D realistic orbits...")
     fig3 = realistic_viz.create_3d_realistic_orbits()
     fig3.write_html('realistic_3d_orbits.html')
 
     print("4. Creating enhanced comparison...")
-    # Show the difference between simplified and realistic
+    # Show the difference between simplified and realistic. The simple
+    # view draws trajectories; closed-form Kepler orbits are enough here
+    solar_system.simulate(time_span=365, n_steps=500, method='kepler')
     from visualization import SolarSystemVisualizer
     simple_viz = SolarSystemVisualizer(solar_system)
     fig_simple, ax_simple = simple_viz.create_static_plot()
-    plt.savefig('comparison_simple_vs_realistic.png', dpi=300, bbox_inches='tight')
+    plt.savefig('comparison_simple_vs_realistic.png', dpi=DPI)
 
     print("\n🎉 Realistic visualizations created!")
     print("📁 New files:")
@@ -278,7 +343,8 @@ def main():
     print("   - realistic_3d_orbits.html (3D with inclinations)")
     print("   - comparison_simple_vs_realistic.png")
 
-    plt.show()
+    if interactive:
+        plt.show()
 
 
 if __name__ == "__main__":
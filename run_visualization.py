@@ -3,12 +3,24 @@
 Simple script to run solar system visualizations
 """
 
+import sys
+import matplotlib
 import matplotlib.pyplot as plt
 from solar_system import SolarSystem
 from visualization import SolarSystemVisualizer
 from statistics import SolarSystemStatistics
 
+# Screen resolution; every figure is laid out with tight_layout when it
+# is built, so the saves skip bbox_inches='tight' and its extra render pass
+DPI = 150
+
+
 def main():
+    # Only --interactive opens windows; plain PNG export needs no GUI canvas
+    interactive = '--interactive' in sys.argv
+    if not interactive:
+        matplotlib.use('Agg')
+
     print("🚀 Initializing Solar System Simulator...")
     
     # Create solar system
@@ -27,13 +39,13 @@ def main():
     # 1. Create static solar system plot
     print("1. Creating static solar system plot...")
     fig1, ax1 = visualizer.create_static_plot()
-    plt.savefig('solar_system.png', dpi=300, bbox_inches='tight')
+    plt.savefig('solar_system.png', dpi=DPI)
     print("   ✅ Saved as 'solar_system.png'")
     
     # 2. Create comparison plots
     print("2. Creating planetary comparison plots...")
     fig2 = visualizer.create_comparison_plots()
-    plt.savefig('planetary_comparison.png', dpi=300, bbox_inches='tight')
+    plt.savefig('planetary_comparison.png', dpi=DPI)
     print("   ✅ Saved as 'planetary_comparison.png'")
     
     # 3. Create 3D plot
@@ -48,17 +60,17 @@ def main():
     
     # Kepler's law verification
     stats.keplers_law_verification()
-    plt.savefig('keplers_law.png', dpi=300, bbox_inches='tight')
+    plt.savefig('keplers_law.png', dpi=DPI)
     print("   ✅ Saved as 'keplers_law.png'")
     
     # Orbital energy analysis
     stats.orbital_energy_analysis()
-    plt.savefig('orbital_energy.png', dpi=300, bbox_inches='tight')
+    plt.savefig('orbital_energy.png', dpi=DPI)
     print("   ✅ Saved as 'orbital_energy.png'")
     
     # Correlation analysis
     stats.correlation_analysis()
-    plt.savefig('correlation_matrix.png', dpi=300, bbox_inches='tight')
+    plt.savefig('correlation_matrix.png', dpi=DPI)
     print("   ✅ Saved as 'correlation_matrix.png'")
     
     print("\n🎉 All visualizations created successfully!")
@@ -70,8 +82,9 @@ def main():
     print("   - orbital_energy.png (energy analysis)")
     print("   - correlation_matrix.png (property correlations)")
     
-    print("\n🖥️ Opening visualizations...")
-    plt.show()
+    if interactive:
+        print("\n🖥️ Opening visualizations...")
+        plt.show()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,58 @@
+"""
+On-disk cache for simulation results
+"""
+
+import hashlib
+import os
+import numpy as np
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'solar_sim')
+
+# Bump whenever the layout or units of the stored history change
+CACHE_FORMAT = 3
+
+
+def cache_key(solar_system, time_span, n_steps, method):
+    """Short hash of the simulation inputs, including the initial state"""
+    state = hashlib.md5()
+    for array in (solar_system.positions, solar_system.velocities, solar_system.masses):
+        state.update(np.ascontiguousarray(array).tobytes())
+
+    params = {
+        'format': CACHE_FORMAT,
+        'n_bodies': len(solar_system.bodies),
+        'time_span': time_span,
+        'n_steps': n_steps,
+        'method': method,
+        'state': state.hexdigest(),
+    }
+    return hashlib.md5(repr(sorted(params.items())).encode()).hexdigest()[:12]
+
+
+def load_or_simulate(solar_system, time_span, n_steps=1000, method='leapfrog'):
+    """Load cached results into solar_system, running simulate() on a miss"""
+    # Key on the state the run would actually start from
+    solar_system.restore_final_state()
+    key = cache_key(solar_system, time_span, n_steps, method)
+    path = os.path.join(CACHE_DIR, f'{key}.npz')
+
+    if os.path.exists(path):
+        with np.load(path) as cached:
+            solar_system.simulation_time = cached['simulation_time']
+            solar_system.history_pos = cached['history_pos']
+            solar_system.history_vel = cached['history_vel']
+            solar_system.set_final_state(cached['final_positions'], cached['final_velocities'])
+        return
+
+    solar_system.simulate(time_span=time_span, n_steps=n_steps, method=method)
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        np.savez(path,
+                 simulation_time=solar_system.simulation_time,
+                 history_pos=solar_system.history_pos,
+                 history_vel=solar_system.history_vel,
+                 final_positions=solar_system.positions,
+                 final_velocities=solar_system.velocities)
+    except OSError as e:
+        print(f"Could not write simulation cache: {e}")
@@ -1,7 +1,9 @@
 import numpy as np
-import json
 from data.constants import *
+from data._loader import load_planet_data_cached
 from scipy.integrate import solve_ivp
+from barnes_hut import Octree
+import kernels
 
 
 class CelestialBody:
@@ -11,10 +13,47 @@ class CelestialBody:
         self.radius = radius
         self.color = color
         self.type = body_type
-        self.position = np.zeros(3)
-        self.velocity = np.zeros(3)
         self.orbit_history = []
 
+        # State lives in the owning SolarSystem's arrays once attached
+        self.system = None
+        self.index = None
+        self._position = np.zeros(3)
+        self._velocity = np.zeros(3)
+
+    def attach(self, system, index):
+        """Move this body's state into row `index` of the system's arrays"""
+        system.positions[index] = self._position
+        system.velocities[index] = self._velocity
+        self.system = system
+        self.index = index
+
+    @property
+    def position(self):
+        if self.system is None:
+            return self._position
+        return self.system.positions[self.index]
+
+    @position.setter
+    def position(self, value):
+        if self.system is None:
+            self._position = np.asarray(value, dtype=np.float64)
+        else:
+            self.system.positions[self.index] = value
+
+    @property
+    def velocity(self):
+        if self.system is None:
+            return self._velocity
+        return self.system.velocities[self.index]
+
+    @velocity.setter
+    def velocity(self, value):
+        if self.system is None:
+            self._velocity = np.asarray(value, dtype=np.float64)
+        else:
+            self.system.velocities[self.index] = value
+
     def set_orbital_parameters(self, semi_major_axis, eccentricity, orbital_period):
         """Set initial orbital parameters"""
         self.semi_major_axis = semi_major_axis
@@ -41,15 +80,23 @@ class CelestialBody:
 
 
 class SolarSystem:
-    def __init__(self):
+    # Set to a body count to take accelerations from a Barnes-Hut octree
+    # above it instead of the exact all-pairs sum. The tree is pure Python:
+    # at N=5000 one force evaluation takes 8 s against 0.1 s for the
+    # compiled sum, so it is off by default
+    barnes_hut_threshold = None
+
+    def __init__(self, theta=0.5):
         self.bodies = []
         self.time = 0
+        self.theta = theta  # Barnes-Hut opening angle
+        self._final_state = None  # float64 (positions, velocities) at the end of the last run
+        self._scrubbed = False
         self.load_planet_data()
 
     def load_planet_data(self):
         """Load planetary data from JSON file"""
-        with open('data/planet_data.json', 'r') as f:
-            data = json.load(f)
+        data = load_planet_data_cached()
 
         for body_name, body_data in data.items():
             body = CelestialBody(
@@ -70,80 +117,272 @@ class SolarSystem:
 
             self.bodies.append(body)
 
+        # Structure-of-arrays state shared with the CelestialBody objects
+        n_bodies = len(self.bodies)
+        self.positions = np.zeros((n_bodies, 3), dtype=np.float64)
+        self.velocities = np.zeros((n_bodies, 3), dtype=np.float64)
+        self.masses = np.array([body.mass for body in self.bodies], dtype=np.float64)
+        self.radii = np.array([body.radius for body in self.bodies], dtype=np.float64)
+        self.names = [body.name for body in self.bodies]
+        self.types = np.array([body.type for body in self.bodies])
+
+        # Orbital elements, NaN for bodies without an orbit (the Sun)
+        def element(name):
+            return np.array([getattr(body, name, np.nan) for body in self.bodies], dtype=np.float64)
+
+        self.semi_major_axes = element('semi_major_axis')
+        self.eccentricities = element('eccentricity')
+        self.orbital_periods = element('orbital_period')
+
+        for i, body in enumerate(self.bodies):
+            body.attach(self, i)
+
+        # The body list is fixed after loading, so look the Sun up once
+        self._sun = next((body for body in self.bodies if body.type == 'star'), None)
+
     def derivatives(self, t, y):
         """Calculate derivatives for the ODE solver"""
         n_bodies = len(self.bodies)
-        derivatives = np.zeros(6 * n_bodies)
 
-        # Unpack positions and velocities
+        # Unpack positions; velocities are already the first half of the result
         positions = y[:3 * n_bodies].reshape(n_bodies, 3)
-        velocities = y[3 * n_bodies:].reshape(n_bodies, 3)
 
-        # Calculate accelerations
-        accelerations = np.zeros((n_bodies, 3))
+        # solve_ivp keeps previous results (e.g. to pick its first step), so
+        # every call gets an array of its own; the accelerations are written
+        # straight into its second half
+        d = np.empty(6 * n_bodies)
+        d[:3 * n_bodies] = y[3 * n_bodies:]
+        self._compute_accelerations(positions, out=d[3 * n_bodies:].reshape(n_bodies, 3))
+        return d
 
-        for i in range(n_bodies):
-            for j in range(n_bodies):
-                if i != j:
-                    r_vec = positions[j] - positions[i]
-                    r_mag = np.linalg.norm(r_vec)
+    def _use_barnes_hut(self, n_bodies):
+        """Whether barnes_hut_threshold puts n_bodies on the octree"""
+        return self.barnes_hut_threshold is not None and n_bodies > self.barnes_hut_threshold
 
-                    if r_mag > 0:
-                        accelerations[i] += (G * self.bodies[j].mass /
-                                             (r_mag ** 3)) * r_vec
+    def _compute_accelerations(self, positions, out=None):
+        """Gravitational acceleration on every body, shape (N, 3).
 
-        # Pack derivatives
-        derivatives[:3 * n_bodies] = velocities.flatten()
-        derivatives[3 * n_bodies:] = accelerations.flatten()
+        Written into out when given, otherwise into a new array.
+        """
+        n_bodies = len(self.bodies)
+        if out is None:
+            out = np.empty((n_bodies, 3))
 
-        return derivatives
+        if self._use_barnes_hut(n_bodies):
+            tree = Octree(positions, self.masses)
+            out[:] = tree.accelerations(positions, theta=self.theta)
+            return out
 
-    def simulate(self, time_span, n_steps=1000):
-        """Run the simulation"""
-        # Initial state vector
-        y0 = np.zeros(6 * len(self.bodies))
+        if kernels.NUMBA_AVAILABLE:
+            # Fused compiled loop, no (N, N, 3) temporaries
+            kernels.accelerations(np.ascontiguousarray(positions), self.masses, G, out)
+            return out
 
-        for i, body in enumerate(self.bodies):
-            y0[3 * i:3 * i + 3] = body.position
-            y0[3 * len(self.bodies) + 3 * i:3 * len(self.bodies) + 3 * i + 3] = body.velocity
+        # Pairwise separations dr[i, j] = r_j - r_i, shape (N, N, 3)
+        dr = positions[None, :, :] - positions[:, None, :]
+        r2 = np.einsum('ijk,ijk->ij', dr, dr)
+
+        # Exclude self-interaction (and coincident bodies) from the sum
+        r2[r2 == 0] = np.inf
+        inv_r3 = r2 ** -1.5
+
+        return np.einsum('ij,j,ijk->ik', G * inv_r3, self.masses, dr, out=out)
+
+    def simulate(self, time_span, n_steps=1000, method='leapfrog'):
+        """Run the simulation
+
+        method is 'leapfrog' (default) or 'yoshida' for the fixed-step
+        symplectic integrators taking one step per output sample, or any
+        scipy solve_ivp method such as 'RK45'. Leapfrog needs one force
+        evaluation per step; Yoshida is 4th order for three. Both keep
+        energy bounded over long runs. 'kepler' skips the N-body problem
+        and uses simulate_kepler().
+        Results are stored as history_pos (AU) / history_vel (m/s), shape
+        (n_steps, N, 3). The history only feeds plotting, so it is kept in
+        float32; the integrator itself runs in float64 and leaves its exact
+        end state in positions / velocities for the next run.
+        """
+        self.restore_final_state()
+        if method == 'kepler':
+            self.simulate_kepler(time_span, n_steps)
+            return
+
+        n_bodies = len(self.bodies)
 
         # Time points
         t_eval = np.linspace(0, time_span, n_steps)
+        self.simulation_time = t_eval
 
-        # Solve ODE
-        solution = solve_ivp(
-            self.derivatives,
-            [0, time_span],
-            y0,
-            t_eval=t_eval,
-            method='RK45',
-            rtol=1e-8
-        )
+        # Trajectory history, allocated once for the whole run
+        self.history_pos = np.empty((n_steps, n_bodies, 3), dtype=np.float32)
+        self.history_vel = np.empty((n_steps, n_bodies, 3), dtype=np.float32)
 
-        # Store results
-        self.simulation_time = solution.t
-        self.simulation_results = solution.y
+        if method == 'leapfrog':
+            pos, vel = self._integrate_symplectic(t_eval, kernels.LEAPFROG_WEIGHTS)
+        elif method == 'yoshida':
+            pos, vel = self._integrate_symplectic(t_eval, kernels.YOSHIDA4_WEIGHTS)
+        else:
+            # Initial state vector
+            y0 = np.concatenate([self.positions.ravel(), self.velocities.ravel()])
 
-        # Update bodies with final positions
-        self.update_bodies_from_solution(-1)
+            # Solve ODE
+            solution = solve_ivp(
+                self.derivatives,
+                [0, time_span],
+                y0,
+                t_eval=t_eval,
+                method=method,
+                rtol=1e-8
+            )
 
-    def update_bodies_from_solution(self, time_index):
-        """Update body positions and velocities from simulation results"""
+            # Store results
+            self.simulation_time = solution.t
+            self.history_pos[:] = solution.y[:3 * n_bodies].T.reshape(-1, n_bodies, 3) * INV_AU
+            self.history_vel[:] = solution.y[3 * n_bodies:].T.reshape(-1, n_bodies, 3)
+            pos = solution.y[:3 * n_bodies, -1].reshape(n_bodies, 3)
+            vel = solution.y[3 * n_bodies:, -1].reshape(n_bodies, 3)
+
+        self.set_final_state(pos, vel)
+
+    def simulate_kepler(self, time_span, n_steps=1000, tabulated=False):
+        """Propagate every planet on its own two-body Kepler orbit.
+
+        Planet-planet forces are ignored: each planet's orbit around the
+        Sun (held fixed) is derived from its current position and velocity,
+        so at t=0 the result matches the N-body methods exactly. Takes the
+        same arguments as simulate() and fills the same history.
+        With tabulated=True sin/cos of the eccentric anomaly come from the
+        interpolated lookup table instead of Newton iteration (about 1e-5
+        accurate, which is enough for plotting). Raises ValueError if a
+        planet is not on a bound (e < 1) orbit.
+        """
+        self.restore_final_state()
         n_bodies = len(self.bodies)
+        t_eval = np.linspace(0, time_span, n_steps)
+        self.simulation_time = t_eval
 
-        for i in range(n_bodies):
-            self.bodies[i].position = self.simulation_results[3 * i:3 * i + 3, time_index]
-            self.bodies[i].velocity = self.simulation_results[3 * n_bodies + 3 * i:3 * n_bodies + 3 * i + 3, time_index]
+        planets = np.flatnonzero(self.types == 'planet')
+        sun = self.get_sun()
+        if sun is None:
+            sun_pos, sun_vel, sun_mass = np.zeros(3), np.zeros(3), SOLAR_MASS
+        else:
+            sun_pos, sun_vel, sun_mass = self.positions[sun.index], self.velocities[sun.index], sun.mass
 
-    def get_body_trajectory(self, body_index):
-        """Get trajectory for a specific body"""
+        # Orbital elements from the heliocentric state vectors
+        r = self.positions[planets] - sun_pos
+        v = self.velocities[planets] - sun_vel
+        mu = G * (sun_mass + self.masses[planets])
+        r_norm = np.linalg.norm(r, axis=1)
+        h = np.cross(r, v)
+        e_vec = np.cross(v, h) / mu[:, None] - r / r_norm[:, None]
+        e = np.linalg.norm(e_vec, axis=1)
+        if np.any(e >= 1):
+            raise ValueError("simulate_kepler needs every planet on a bound orbit (e < 1)")
+        a = 1 / (2 / r_norm - np.einsum('ij,ij->i', v, v) / mu)
+        b = a * np.sqrt(1 - e ** 2)
+
+        # Perifocal frame: P towards perihelion (or the current position on
+        # a circular orbit), Q 90 degrees ahead in the orbital plane
+        circular = e < 1e-12
+        P = np.where(circular[:, None], r / r_norm[:, None], e_vec / np.where(circular, 1, e)[:, None])
+        Q = np.cross(h / np.linalg.norm(h, axis=1)[:, None], P)
+
+        # Mean anomaly for every (time, planet) pair, solved for E in one call
+        E0 = np.arctan2(np.einsum('ij,ij->i', r, Q) / b, np.einsum('ij,ij->i', r, P) / a + e)
+        mean_motion = np.sqrt(mu / a ** 3)
+        M = (E0 - e * np.sin(E0)) + np.outer(t_eval, mean_motion)
+        if tabulated:
+            sin_E, cos_E = kernels.kepler_sincos(M, e)
+        else:
+            E = kernels.kepler_E(M, e)
+            cos_E = np.cos(E)
+            sin_E = np.sin(E)
+        E_dot = mean_motion / (1 - e * cos_E)
+
+        pos = (a * (cos_E - e))[..., None] * P + (b * sin_E)[..., None] * Q + sun_pos
+        vel = ((-a * sin_E * E_dot)[..., None] * P + (b * cos_E * E_dot)[..., None] * Q) + sun_vel
+
+        # Bodies without elements (the Sun) stay where they are
+        self.history_pos = np.empty((n_steps, n_bodies, 3), dtype=np.float32)
+        self.history_vel = np.empty((n_steps, n_bodies, 3), dtype=np.float32)
+        self.history_pos[:] = self.positions * INV_AU
+        self.history_vel[:] = self.velocities
+        self.history_pos[:, planets] = pos * INV_AU
+        self.history_vel[:, planets] = vel
+
+        final_pos = self.positions.copy()
+        final_vel = self.velocities.copy()
+        final_pos[planets] = pos[-1]
+        final_vel[planets] = vel[-1]
+        self.set_final_state(final_pos, final_vel)
+
+    def _integrate_symplectic(self, t_eval, weights):
+        """Fixed-step symplectic integration over the uniform grid t_eval.
+
+        Each step is a sequence of kick-drift-kick leapfrog sub-steps of
+        length weights[k] * dt. Returns the float64 end state (pos, vel).
+        """
         n_bodies = len(self.bodies)
-        trajectory = self.simulation_results[3 * body_index:3 * body_index + 3, :]
-        return trajectory.T
+        pos = self.positions.copy()
+        vel = self.velocities.copy()
+        dt = t_eval[1] - t_eval[0] if len(t_eval) > 1 else 0.0
+
+        # The compiled integrator uses the exact all-pairs sum; systems put
+        # on the Barnes-Hut tree go through _compute_accelerations instead
+        if kernels.NUMBA_AVAILABLE and not self._use_barnes_hut(n_bodies):
+            kernels.integrate(pos, vel, self.masses, G, dt, weights,
+                              self.history_pos, self.history_vel, INV_AU)
+            return pos, vel
+
+        self.history_pos[0] = pos * INV_AU
+        self.history_vel[0] = vel
+        acc = self._compute_accelerations(pos)
+
+        for step in range(1, len(t_eval)):
+            for w in weights:
+                vel += 0.5 * w * dt * acc
+                pos += w * dt * vel
+                acc = self._compute_accelerations(pos)
+                vel += 0.5 * w * dt * acc
+
+            self.history_pos[step] = pos * INV_AU
+            self.history_vel[step] = vel
+
+        return pos, vel
+
+    def set_final_state(self, positions, velocities):
+        """Make the float64 end state of a run the current state"""
+        self.positions[:] = positions
+        self.velocities[:] = velocities
+        self._final_state = (self.positions.copy(), self.velocities.copy())
+        self._scrubbed = False
+
+    def restore_final_state(self):
+        """Put back the end state if a scrubbed frame is showing"""
+        if self._scrubbed:
+            self.positions[:], self.velocities[:] = self._final_state
+            self._scrubbed = False
+
+    def update_bodies_from_solution(self, time_index):
+        """Update body positions and velocities from simulation results.
+
+        Frames come from the float32 history and are for display only: the
+        next simulate() starts from the float64 end state, not from a
+        scrubbed frame. The last frame shows that end state exactly.
+        """
+        if self._final_state is not None and time_index in (-1, len(self.history_pos) - 1):
+            self.positions[:], self.velocities[:] = self._final_state
+            self._scrubbed = False
+            return
+
+        self.positions[:] = self.history_pos[time_index] * AU
+        self.velocities[:] = self.history_vel[time_index]
+        self._scrubbed = self._final_state is not None
+
+    def get_body_trajectory(self, body_index):
+        """Get trajectory for a specific body in AU, shape (n_steps, 3)"""
+        return self.history_pos[:, body_index, :]
 
     def get_sun(self):
         """Get the sun object"""
-        for body in self.bodies:
-            if body.type == 'star':
-                return body
-        return None
\ No newline at end of file
+        return self._sun
\ No newline at end of file
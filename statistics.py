@@ -7,44 +7,59 @@ from data.constants import G, AU  # Added import for G and AU
 class SolarSystemStatistics:
     def __init__(self, solar_system):
         self.solar_system = solar_system
+        self._stats_df = None
+        self._stats_state = None
+    
+    @property
+    def stats_df(self):
+        """calculate_orbital_statistics(), recomputed only when the system state changes"""
+        state = (self.solar_system.positions.tobytes(), self.solar_system.velocities.tobytes())
+        if self._stats_state != state:
+            self._stats_df = self.calculate_orbital_statistics()
+            self._stats_state = state
+        return self._stats_df
         
     def calculate_orbital_statistics(self):
         """Calculate comprehensive orbital statistics"""
-        planets_data = []
-        
-        for body in self.solar_system.bodies:
-            if body.type == 'planet':
-                # Calculate orbital energy and angular momentum
-                sun = self.solar_system.get_sun()
-                if sun:
-                    r = np.linalg.norm(body.position - sun.position)
-                    v = np.linalg.norm(body.velocity)
-                    
-                    # Orbital energy per unit mass
-                    energy = 0.5 * v**2 - G * sun.mass / r
-                    
-                    # Specific angular momentum
-                    r_vec = body.position - sun.position
-                    v_vec = body.velocity
-                    angular_momentum = np.linalg.norm(np.cross(r_vec, v_vec))
-                    
-                    planets_data.append({
-                        'name': body.name,
-                        'semi_major_axis': body.semi_major_axis,
-                        'eccentricity': body.eccentricity,
-                        'orbital_period': body.orbital_period,
-                        'mass': body.mass,
-                        'radius': body.radius,
-                        'orbital_energy': energy,
-                        'angular_momentum': angular_momentum,
-                        'orbital_speed': v
-                    })
-        
-        return pd.DataFrame(planets_data)
+        system = self.solar_system
+        sun = system.get_sun()
+        if not sun:
+            return pd.DataFrame()
+        
+        # All planets at once, as rows of the state arrays
+        planets = np.flatnonzero(system.types == 'planet')
+        r_vec = system.positions[planets] - system.positions[sun.index]
+        v_vec = system.velocities[planets]
+        r = np.sqrt(np.einsum('ij,ij->i', r_vec, r_vec))
+        v = np.sqrt(np.einsum('ij,ij->i', v_vec, v_vec))
+        
+        # Orbital energy per unit mass
+        energy = 0.5 * v**2 - G * sun.mass / r
+        
+        # Specific angular momentum |r x v|, with the cross product written
+        # out per component rather than going through np.cross
+        rx, ry, rz = r_vec.T
+        vx, vy, vz = v_vec.T
+        lx = ry * vz - rz * vy
+        ly = rz * vx - rx * vz
+        lz = rx * vy - ry * vx
+        angular_momentum = np.sqrt(lx * lx + ly * ly + lz * lz)
+        
+        return pd.DataFrame({
+            'name': [system.names[i] for i in planets],
+            'semi_major_axis': system.semi_major_axes[planets],
+            'eccentricity': system.eccentricities[planets],
+            'orbital_period': system.orbital_periods[planets],
+            'mass': system.masses[planets],
+            'radius': system.radii[planets],
+            'orbital_energy': energy,
+            'angular_momentum': angular_momentum,
+            'orbital_speed': v
+        })
     
     def keplers_law_verification(self):
         """Verify Kepler's third law"""
-        df = self.calculate_orbital_statistics()
+        df = self.stats_df
         
         # Kepler's third law: T² ∝ a³
         T = df['orbital_period']  # in days
@@ -66,7 +81,7 @@ class SolarSystemStatistics:
     
     def orbital_energy_analysis(self):
         """Analyze orbital energies"""
-        df = self.calculate_orbital_statistics()
+        df = self.stats_df
         
         fig, axes = plt.subplots(1, 2, figsize=(15, 6))
         
@@ -96,7 +111,7 @@ class SolarSystemStatistics:
     
     def planetary_comparison_table(self):
         """Create a comprehensive comparison table"""
-        df = self.calculate_orbital_statistics()
+        df = self.stats_df.copy()
         
         # Create normalized values for comparison
         df['mass_relative'] = df['mass'] / df['mass'].max()
@@ -123,13 +138,14 @@ class SolarSystemStatistics:
     
     def correlation_analysis(self):
         """Perform correlation analysis between planetary properties"""
-        df = self.calculate_orbital_statistics()
-        
         # Select numerical columns for correlation
         numerical_cols = ['mass', 'radius', 'semi_major_axis', 'orbital_period', 
                          'eccentricity', 'orbital_energy', 'angular_momentum']
         
-        correlation_matrix = df[numerical_cols].corr()
+        # Plain (N, 7) array: np.corrcoef is far cheaper than DataFrame.corr
+        # for a handful of planets
+        data = self.stats_df[numerical_cols].to_numpy(dtype=np.float64)
+        correlation_matrix = np.corrcoef(data, rowvar=False)
         
         # Plot correlation heatmap
         fig, ax = plt.subplots(figsize=(10, 8))
@@ -138,7 +154,7 @@ class SolarSystemStatistics:
         # Add correlation values as text
         for i in range(len(numerical_cols)):
             for j in range(len(numerical_cols)):
-                text = ax.text(j, i, f'{correlation_matrix.iloc[i, j]:.2f}',
+                text = ax.text(j, i, f'{correlation_matrix[i, j]:.2f}',
                               ha="center", va="center", color="black")
         
         ax.set_xticks(range(len(numerical_cols)))
@@ -0,0 +1,66 @@
+"""
+Tests for the Barnes-Hut octree against the direct all-pairs sum
+"""
+
+import numpy as np
+import pytest
+
+from barnes_hut import Octree
+from data.constants import G
+
+
+def direct_accelerations(positions, masses):
+    """Exact all-pairs accelerations, skipping coincident pairs"""
+    dr = positions[None, :, :] - positions[:, None, :]
+    r2 = np.einsum('ijk,ijk->ij', dr, dr)
+    r2[r2 == 0] = np.inf
+    return G * np.einsum('ij,j,ijk->ik', r2 ** -1.5, masses, dr)
+
+
+def relative_errors(approx, exact):
+    return np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+
+
+@pytest.fixture
+def cloud():
+    """Random 200-body cloud of roughly solar-system scale"""
+    rng = np.random.default_rng(1)
+    positions = rng.normal(scale=1e11, size=(200, 3))
+    masses = rng.uniform(1e20, 1e24, size=200)
+    return positions, masses
+
+
+def test_theta_zero_matches_direct_sum(cloud):
+    positions, masses = cloud
+    tree = Octree(positions, masses)
+    errors = relative_errors(tree.accelerations(positions, theta=0.0),
+                             direct_accelerations(positions, masses))
+    assert errors.max() < 1e-12
+
+
+def test_theta_half_error_bound(cloud):
+    positions, masses = cloud
+    tree = Octree(positions, masses)
+    errors = relative_errors(tree.accelerations(positions, theta=0.5),
+                             direct_accelerations(positions, masses))
+    # Every body within 10%, typical bodies within 1%
+    assert errors.max() < 0.1
+    assert np.median(errors) < 0.01
+
+
+def test_coincident_bodies():
+    positions = np.array([[1e11, 0, 0], [1e11, 0, 0], [1e11, 0, 0], [-1e11, 2e10, 0]])
+    masses = np.array([1e24, 2e24, 3e24, 5e24])
+    tree = Octree(positions, masses)
+    np.testing.assert_allclose(tree.accelerations(positions, theta=0.0),
+                               direct_accelerations(positions, masses), rtol=1e-12)
+
+
+def test_near_coincident_bodies():
+    # One ulp apart: the tree subdivides until the cells stop shrinking
+    x = 1e11
+    positions = np.array([[x, 0, 0], [np.nextafter(x, np.inf), 0, 0], [0, 0, 0]])
+    masses = np.array([1e20, 1e20, 2e30])
+    tree = Octree(positions, masses)
+    np.testing.assert_allclose(tree.accelerations(positions, theta=0.5),
+                               direct_accelerations(positions, masses), rtol=1e-12)
@@ -0,0 +1,117 @@
+"""
+Tests for the compiled kernels and the integrators built on them
+"""
+
+import importlib.util
+import sys
+
+import numpy as np
+import pytest
+
+import kernels
+from data.constants import AU, G
+from solar_system import SolarSystem
+
+# simulate() takes its time span in seconds
+TWO_YEARS = 2 * 365.25 * 86400
+
+
+def total_energy(system, k):
+    """Kinetic plus potential energy of history sample k"""
+    pos = system.history_pos[k].astype(np.float64) * AU
+    vel = system.history_vel[k].astype(np.float64)
+    m = system.masses
+    kinetic = 0.5 * (m * (vel ** 2).sum(axis=1)).sum()
+    i, j = np.triu_indices(len(m), 1)
+    r = np.linalg.norm(pos[i] - pos[j], axis=1)
+    return kinetic - G * (m[i] * m[j] / r).sum()
+
+
+@pytest.fixture(scope='module')
+def reference():
+    system = SolarSystem()
+    system.simulate(TWO_YEARS, n_steps=1000, method='RK45')
+    return system.history_pos.astype(np.float64)
+
+
+@pytest.mark.parametrize('method, tolerance', [('leapfrog', 0.05), ('yoshida', 1e-3)])
+def test_symplectic_matches_rk45(reference, method, tolerance):
+    system = SolarSystem()
+    system.simulate(TWO_YEARS, n_steps=1000, method=method)
+    # Worst position error over the run, in AU; Mercury dominates
+    error = np.linalg.norm(system.history_pos - reference, axis=-1).max()
+    assert error < tolerance
+
+
+@pytest.mark.parametrize('method', ['leapfrog', 'yoshida'])
+def test_symplectic_conserves_energy(method):
+    system = SolarSystem()
+    system.simulate(TWO_YEARS, n_steps=1000, method=method)
+    energy = np.array([total_energy(system, k) for k in range(0, 1000, 50)])
+    assert np.abs(energy / energy[0] - 1).max() < 1e-6
+
+
+def test_kepler_E_residual():
+    M = np.linspace(-4 * np.pi, 4 * np.pi, 2001)
+    for e in (0.0, 0.0167, 0.2056, 0.5, 0.9, 0.97, 0.99, 0.999):
+        E = kernels.kepler_E(M, np.full_like(M, e))
+        assert np.abs(E - e * np.sin(E) - M).max() < 1e-12
+
+
+def test_kepler_sincos_accuracy():
+    M, e = np.meshgrid(np.linspace(0, 2 * np.pi, 501), np.linspace(0, 0.5, 51))
+    sin_E, cos_E = kernels.kepler_sincos(M, e)
+    E = kernels.kepler_E(M, e)
+    assert np.abs(sin_E - np.sin(E)).max() < 1e-5
+    assert np.abs(cos_E - np.cos(E)).max() < 1e-5
+
+
+def test_kepler_sincos_rejects_high_eccentricity():
+    with pytest.raises(ValueError):
+        kernels.kepler_sincos(np.zeros(3), np.array([0.1, 0.51, 0.2]))
+
+
+@pytest.fixture
+def fallback(monkeypatch):
+    """A second copy of kernels imported as if Numba were missing"""
+    # Only the import is blocked; the compiled kernels still need numba later
+    with monkeypatch.context() as patch:
+        patch.setitem(sys.modules, 'numba', None)
+        spec = importlib.util.spec_from_file_location('kernels_fallback', kernels.__file__)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    assert not module.NUMBA_AVAILABLE
+    return module
+
+
+def test_fallback_accelerations(fallback):
+    system = SolarSystem()
+    compiled = np.empty_like(system.positions)
+    python = np.empty_like(system.positions)
+    kernels.accelerations(system.positions, system.masses, G, compiled)
+    fallback.accelerations(system.positions, system.masses, G, python)
+    np.testing.assert_allclose(python, compiled, rtol=1e-12)
+
+
+@pytest.mark.parametrize('weights', ['LEAPFROG_WEIGHTS', 'YOSHIDA4_WEIGHTS'])
+def test_fallback_integrate(fallback, weights):
+    system = SolarSystem()
+    results = []
+    for module in (kernels, fallback):
+        pos = system.positions.copy()
+        vel = system.velocities.copy()
+        out_pos = np.empty((20, len(pos), 3))
+        out_vel = np.empty_like(out_pos)
+        module.integrate(pos, vel, system.masses, G, 86400.0, getattr(module, weights),
+                         out_pos, out_vel, 1.0 / AU)
+        results.append((out_pos, out_vel))
+    np.testing.assert_allclose(results[1][0], results[0][0], rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(results[1][1], results[0][1], rtol=1e-12, atol=1e-6)
+
+
+def test_fallback_kepler(fallback):
+    M = np.linspace(0, 2 * np.pi, 257)
+    e = np.linspace(0, 0.5, 257)
+    np.testing.assert_allclose(fallback.kepler_E(M, e), kernels.kepler_E(M, e), rtol=0, atol=1e-14)
+    for python, compiled in zip(fallback.kepler_sincos(M, e), kernels.kepler_sincos(M, e)):
+        np.testing.assert_allclose(python, compiled, rtol=0, atol=1e-14)
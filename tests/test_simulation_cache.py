@@ -0,0 +1,65 @@
+"""
+Tests for the on-disk simulation cache
+"""
+
+import numpy as np
+import pytest
+
+import simulation_cache
+from simulation_cache import load_or_simulate
+from solar_system import SolarSystem
+
+TIME_SPAN = 10 * 86400
+
+
+@pytest.fixture
+def runs(monkeypatch, tmp_path):
+    """Point the cache at tmp_path and count the simulate() calls"""
+    monkeypatch.setattr(simulation_cache, 'CACHE_DIR', str(tmp_path))
+    calls = []
+    simulate = SolarSystem.simulate
+
+    def counting_simulate(self, *args, **kwargs):
+        calls.append(kwargs)
+        return simulate(self, *args, **kwargs)
+
+    monkeypatch.setattr(SolarSystem, 'simulate', counting_simulate)
+    return calls
+
+
+def test_second_call_hits(runs):
+    first = SolarSystem()
+    load_or_simulate(first, TIME_SPAN, n_steps=20)
+    second = SolarSystem()
+    load_or_simulate(second, TIME_SPAN, n_steps=20)
+
+    assert len(runs) == 1
+    for name in ('history_pos', 'history_vel', 'simulation_time'):
+        np.testing.assert_array_equal(getattr(second, name), getattr(first, name))
+    np.testing.assert_array_equal(second.positions, first.positions)
+    np.testing.assert_array_equal(second.velocities, first.velocities)
+
+
+@pytest.mark.parametrize('kwargs', [{'method': 'yoshida'}, {'n_steps': 21}])
+def test_parameters_miss(runs, kwargs):
+    load_or_simulate(SolarSystem(), TIME_SPAN, n_steps=20)
+    load_or_simulate(SolarSystem(), TIME_SPAN, **{'n_steps': 20, **kwargs})
+    assert len(runs) == 2
+
+
+def test_initial_state_misses(runs):
+    load_or_simulate(SolarSystem(), TIME_SPAN, n_steps=20)
+    system = SolarSystem()
+    system.velocities[1, 1] *= 1.01
+    load_or_simulate(system, TIME_SPAN, n_steps=20)
+    assert len(runs) == 2
+
+
+def test_stale_format_ignored(runs, monkeypatch, tmp_path):
+    with monkeypatch.context() as patch:
+        patch.setattr(simulation_cache, 'CACHE_FORMAT', simulation_cache.CACHE_FORMAT - 1)
+        load_or_simulate(SolarSystem(), TIME_SPAN, n_steps=20)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    load_or_simulate(SolarSystem(), TIME_SPAN, n_steps=20)
+    assert len(runs) == 2
@@ -0,0 +1,87 @@
+"""
+Tests for SolarSystem state handling between runs
+"""
+
+import numpy as np
+import pytest
+
+from data.constants import AU
+from solar_system import SolarSystem
+
+TIME_SPAN = 30 * 86400
+
+
+@pytest.mark.parametrize('method', ['leapfrog', 'yoshida', 'RK45', 'kepler'])
+def test_end_state_is_float64(method):
+    system = SolarSystem()
+    system.simulate(TIME_SPAN, n_steps=50, method=method)
+    # The float32 history is off by up to ~1e5 m; the state must not be
+    rounded = system.history_pos[-1].astype(np.float64) * AU
+    assert np.abs(system.positions - rounded).max() > 0
+    np.testing.assert_allclose(system.positions, rounded, rtol=1e-6, atol=1e3)
+
+
+def test_scrubbed_frame_is_not_a_start_state():
+    reference = SolarSystem()
+    reference.simulate(TIME_SPAN, n_steps=50)
+    reference.simulate(TIME_SPAN, n_steps=50)
+
+    system = SolarSystem()
+    system.simulate(TIME_SPAN, n_steps=50)
+    system.update_bodies_from_solution(10)
+    np.testing.assert_array_equal(system.positions, system.history_pos[10] * AU)
+    system.simulate(TIME_SPAN, n_steps=50)
+
+    np.testing.assert_array_equal(system.positions, reference.positions)
+    np.testing.assert_array_equal(system.history_pos, reference.history_pos)
+
+
+def test_last_frame_shows_end_state():
+    system = SolarSystem()
+    system.simulate(TIME_SPAN, n_steps=50)
+    end = system.positions.copy()
+    system.update_bodies_from_solution(0)
+    system.update_bodies_from_solution(-1)
+    np.testing.assert_array_equal(system.positions, end)
+
+
+@pytest.mark.parametrize('tabulated', [False, True])
+def test_kepler_starts_from_current_state(tabulated):
+    system = SolarSystem()
+    start_pos = system.positions.copy()
+    start_vel = system.velocities.copy()
+    system.simulate_kepler(TIME_SPAN, n_steps=50, tabulated=tabulated)
+    np.testing.assert_allclose(system.history_pos[0] * AU, start_pos, rtol=1e-6, atol=1e3)
+    np.testing.assert_allclose(system.history_vel[0], start_vel, rtol=1e-5, atol=1e-2)
+
+
+def test_kepler_follows_inclined_eccentric_orbit():
+    system = SolarSystem()
+    # Tilt Mars' orbit and make it eccentric by speeding it up
+    system.velocities[4] = system.velocities[4] * 1.1 + [0, 0, 2000.0]
+    kepler = SolarSystem()
+    kepler.positions[:] = system.positions
+    kepler.velocities[:] = system.velocities
+
+    system.simulate(TIME_SPAN, n_steps=200, method='yoshida')
+    kepler.simulate(TIME_SPAN, n_steps=200, method='kepler')
+    # Planet-planet forces are all Kepler leaves out over a month
+    error = np.linalg.norm(kepler.history_pos - system.history_pos, axis=-1)[:, 1:]
+    assert error.max() < 1e-4
+
+
+def test_derivatives_without_simulate():
+    system = SolarSystem()
+    y = np.concatenate([system.positions.ravel(), system.velocities.ravel()])
+    first = system.derivatives(0.0, y)
+    second = system.derivatives(0.0, y)
+    assert first is not second
+    np.testing.assert_array_equal(first[:y.size // 2], system.velocities.ravel())
+    np.testing.assert_array_equal(first[y.size // 2:], system._compute_accelerations(system.positions).ravel())
+
+
+def test_barnes_hut_opt_in():
+    system = SolarSystem()
+    exact = system._compute_accelerations(system.positions)
+    system.barnes_hut_threshold = 4
+    np.testing.assert_allclose(system._compute_accelerations(system.positions), exact, rtol=0.1)
@@ -5,13 +5,28 @@ ULTRA-REALISTIC Solar System Visualizations with Outstanding Colors
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import Ellipse, Circle
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from matplotlib.patches import Ellipse, Circle, Patch
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.lines import Line2D
 import matplotlib.colors as mcolors
 from solar_system import SolarSystem
+import kernels
 from data.constants import AU
-import json
+from data._loader import load_planet_data_cached
+
+# Shared angle grid for every sampled orbit
+_THETA = np.linspace(0, 2 * np.pi, 200)
+_COS_T = np.cos(_THETA)
+_SIN_T = np.sin(_THETA)
+
+# 20% white over the panel background, baked into an opaque colour so the
+# grid lines are drawn without alpha blending
+GRID_COLOR = mcolors.to_hex(0.8 * np.array(mcolors.to_rgb('#0B0B3B')) + 0.2)
+
+# 3750 x 2250 px for the 25 x 15 inch overview, sharp enough for print. The
+# grid spacing keeps every panel inside the figure, so like the other
+# scripts the save skips bbox_inches='tight' and its extra render pass
+DPI = 150
 
 
 class UltraRealisticVisualizer:
@@ -20,6 +35,11 @@ class UltraRealisticVisualizer:
         self.load_enhanced_planet_data()
         self.setup_stunning_colors()
 
+        # Starfields are drawn once and reused by every later figure
+        self._rng = np.random.default_rng(0)
+        self._starfields = {}
+        self._starfield_3d = None
+
     def setup_stunning_colors(self):
         """Enhanced color scheme with gradients and realistic hues"""
         self.planet_colors = {
@@ -36,10 +56,13 @@ class UltraRealisticVisualizer:
 
         self.background_gradient = ['#0B0B3B', '#1A1A4B', '#2D2D5B']  # Space nebula
 
+        # Gradient stops aligned with planet_order: orbit, fill and edge
+        self.p_orbit_colors, self.p_fill_colors, self.p_edge_colors = \
+            np.array([self.planet_colors[p] for p in self.planet_order]).T
+
     def load_enhanced_planet_data(self):
         """Load enhanced planetary data with textures and features"""
-        with open('data/planet_data.json', 'r') as f:
-            self.planet_data = json.load(f)
+        self.planet_data = load_planet_data_cached()
 
         # Add realistic orbital inclinations (degrees)
         self.orbital_inclinations = {
@@ -53,6 +76,65 @@ class UltraRealisticVisualizer:
             'jupiter': 3.1, 'saturn': 26.7, 'uranus': 97.8, 'neptune': 28.3
         }
 
+        # Average temperatures (Kelvin)
+        self.average_temperatures = {
+            'mercury': 440, 'venus': 737, 'earth': 288, 'mars': 210,
+            'jupiter': 165, 'saturn': 134, 'uranus': 76, 'neptune': 72
+        }
+
+        # Simplified composition data (rock/gas/ice percentages)
+        self.compositions = {
+            'mercury': [70, 30, 0], 'venus': [65, 35, 0], 'earth': [67, 33, 0], 'mars': [60, 40, 0],
+            'jupiter': [10, 90, 0], 'saturn': [15, 85, 0], 'uranus': [20, 30, 50], 'neptune': [25, 35, 40]
+        }
+
+        # Year of discovery, negative for BCE (Earth is left out)
+        self.discovery_years = {
+            'mercury': -3000, 'venus': -3000, 'mars': -3000, 'jupiter': -3000, 'saturn': -3000,
+            'uranus': 1781, 'neptune': 1846
+        }
+
+        # Per-planet arrays in Mercury -> Neptune order, so the plot routines
+        # read columns instead of walking the dicts above
+        self.planet_order = [p for p, data in self.planet_data.items() if data['type'] == 'planet']
+        self.planet_names = [self.planet_data[p]['name'] for p in self.planet_order]
+
+        def column(key):
+            return np.array([self.planet_data[p][key] for p in self.planet_order], dtype=np.float64)
+
+        self.p_a = column('semi_major_axis')
+        self.p_a_AU = self.p_a / AU
+        self.p_ecc = column('eccentricity')
+        self.p_radius = column('radius')
+        self.p_inclination = np.radians([self.orbital_inclinations.get(p, 0) for p in self.planet_order])
+
+        # Split between the inner and outer system panels
+        self._inner = np.isin(self.planet_order, ['mercury', 'venus', 'earth', 'mars'])
+
+        # Planet marker areas relative to actual scale (log for visibility)
+        self._marker_size_inner = np.maximum(20, np.log(self.p_radius[self._inner] / 1e6) * 30)
+        self._marker_size_outer = np.maximum(30, np.log(self.p_radius[~self._inner] / 1e7) * 40)
+
+        self.p_temp_k = np.array([self.average_temperatures[p] for p in self.planet_order])
+        # Shape (n_planets, 3), with the left edge of each stacked segment
+        self.p_composition = np.array([self.compositions[p] for p in self.planet_order], dtype=np.int16)
+        self._composition_left = np.cumsum(self.p_composition, axis=1) - self.p_composition
+
+        # The planets on the discovery timeline, still in planet_order
+        self._discovered = np.isin(self.planet_order, list(self.discovery_years))
+        self.p_discovery_year = np.array([self.discovery_years[p] for p in self.planet_order
+                                          if p in self.discovery_years])
+
+        # Approximate circular orbital velocity (km/s)
+        self.p_orbital_velocity_kms = np.sqrt(6.67430e-11 * 1.989e30 / self.p_a) / 1000
+
+        # Bar labels never change, so they are formatted once here
+        self._vel_labels = [f'{vel:.1f} km/s' for vel in self.p_orbital_velocity_kms]
+        self._temp_labels = [f'{temp}K' for temp in self.p_temp_k]
+        years = self.p_discovery_year
+        self._discovery_labels = np.char.add(np.abs(years).astype(str),
+                                             np.where(years < 0, ' BCE', ' CE')).tolist()
+
     def create_galactic_overview(self):
         """Create a stunning galactic overview with multiple sections"""
         fig = plt.figure(figsize=(25, 15))
@@ -106,96 +188,110 @@ class UltraRealisticVisualizer:
         # Plot sun with glow effect
         sun_glow = plt.Circle((0, 0), 0.15, color='yellow', alpha=0.3)
         ax.add_patch(sun_glow)
-        ax.scatter(0, 0, color='#FFD700', s=500, label='Sun', edgecolors='orange', linewidth=2)
-
-        inner_planets = ['mercury', 'venus', 'earth', 'mars']
-
-        for i, planet_name in enumerate(inner_planets):
-            planet_data = self.planet_data[planet_name]
-            a = planet_data['semi_major_axis'] / AU
-            e = planet_data['eccentricity']
-
-            # Create realistic elliptical orbit
-            theta = np.linspace(0, 2 * np.pi, 200)
-            r = a * (1 - e ** 2) / (1 + e * np.cos(theta))
-            x = r * np.cos(theta)
-            y = r * np.sin(theta)
-
-            # Plot orbit with gradient
-            colors = self.planet_colors[planet_name]
-            ax.plot(x, y, color=colors[0], linewidth=2, alpha=0.8,
-                    label=f"{planet_data['name']} Orbit")
-
-            # Plot planet with size relative to actual scale (log for visibility)
-            planet_size = max(20, np.log(planet_data['radius'] / 1e6) * 30)
-            ax.scatter(x[0], y[0], color=colors[1], s=planet_size,
-                       label=planet_data['name'], edgecolors=colors[2], linewidth=1.5)
+        sun = ax.scatter(0, 0, color='#FFD700', s=500, label='Sun', edgecolors='orange', linewidth=2)
+
+        inner = self._inner
+        a = self.p_a_AU[inner]
+        e = self.p_ecc[inner]
+
+        # Create realistic elliptical orbits, one row per planet
+        if kernels.NUMBA_AVAILABLE:
+            # Fused compiled loop, no broadcast temporaries
+            xs, ys = kernels.planar_orbits(a, e, _COS_T, _SIN_T)
+        else:
+            r = (a * (1 - e ** 2))[:, None] / (1 + e[:, None] * _COS_T)
+            xs = r * _COS_T
+            ys = r * _SIN_T
+
+        names = np.compress(inner, self.planet_names)
+        orbit_colors = self.p_orbit_colors[inner]
+        planet_colors = self.p_fill_colors[inner]
+        edge_colors = self.p_edge_colors[inner]
+
+        # Plot all orbits as one collection and all planets as one scatter
+        ax.add_collection(LineCollection(np.stack((xs, ys), axis=-1), colors=orbit_colors,
+                                         linewidths=2, alpha=0.8, rasterized=True))
+
+        planet_sizes = self._marker_size_inner
+        ax.scatter(xs[:, 0], ys[:, 0], color=planet_colors, s=planet_sizes,
+                   edgecolors=edge_colors, linewidth=1.5)
+
+        # The batched artists have no per-planet labels; legend stand-ins
+        # for each orbit followed by its planet
+        handles = [sun]
+        for name, orbit_color, color, edge, size in zip(names, orbit_colors, planet_colors,
+                                                        edge_colors, planet_sizes):
+            handles.append(Line2D([], [], color=orbit_color, linewidth=2, alpha=0.8, label=f"{name} Orbit"))
+            handles.append(Line2D([], [], linestyle='', marker='o', markersize=np.sqrt(size), color=color,
+                                  markeredgecolor=edge, markeredgewidth=1.5, label=name))
 
         ax.set_xlim(-2, 2)
         ax.set_ylim(-2, 2)
         ax.set_title('🔭 INNER SOLAR SYSTEM', color='white', fontsize=14, fontweight='bold')
-        ax.legend(facecolor='#1A1A4B', edgecolor='white', labelcolor='white')
-        ax.grid(True, alpha=0.2, color='white')
+        ax.legend(handles=handles, facecolor='#1A1A4B', edgecolor='white', labelcolor='white')
+        ax.set_axisbelow(True)
+        ax.grid(True, color=GRID_COLOR)
 
     def _plot_outer_system_artistic(self, ax):
         """Artistic outer solar system with logarithmic scale"""
         ax.set_facecolor('#0B0B3B')
         self._create_starfield(ax, 300)
 
-        outer_planets = ['jupiter', 'saturn', 'uranus', 'neptune']
+        outer = np.flatnonzero(~self._inner)
 
         # Plot sun
-        ax.scatter(0, 0, color='#FFD700', s=100, label='Sun')
-
-        for i, planet_name in enumerate(outer_planets):
-            planet_data = self.planet_data[planet_name]
-            a = planet_data['semi_major_axis'] / AU
-            e = planet_data['eccentricity']
-
-            # Use logarithmic scale for outer planets
-            log_a = np.log10(a)
-
-            # Create orbit circle (simplified for outer system)
-            orbit = plt.Circle((0, 0), log_a, fill=False,
-                               edgecolor=self.planet_colors[planet_name][0],
-                               linewidth=2, alpha=0.7,
-                               label=f"{planet_data['name']} Orbit")
-            ax.add_patch(orbit)
-
-            # Plot planet
-            planet_size = max(30, np.log(planet_data['radius'] / 1e7) * 40)
-            angle = i * (2 * np.pi / len(outer_planets))
-            x = log_a * np.cos(angle)
-            y = log_a * np.sin(angle)
-
-            ax.scatter(x, y, color=self.planet_colors[planet_name][1],
-                       s=planet_size, label=planet_data['name'],
-                       edgecolors=self.planet_colors[planet_name][2], linewidth=2)
+        sun = ax.scatter(0, 0, color='#FFD700', s=100, label='Sun')
+
+        # Use logarithmic scale for outer planets, spread evenly in angle
+        log_a = np.log10(self.p_a_AU[outer])
+        angle = np.arange(len(outer)) * (2 * np.pi / len(outer))
+        xs = log_a * np.cos(angle)
+        ys = log_a * np.sin(angle)
+
+        orbit_colors = self.p_orbit_colors[outer]
+        planet_colors = self.p_fill_colors[outer]
+        edge_colors = self.p_edge_colors[outer]
+
+        # Orbit circles (simplified for outer system), all in one collection
+        # of data-unit ellipses centred on the sun
+        diameters = 2 * log_a
+        ax.add_collection(EllipseCollection(diameters, diameters, np.zeros_like(diameters), units='xy',
+                                            offsets=np.zeros((len(outer), 2)), offset_transform=ax.transData,
+                                            facecolors='none', edgecolors=orbit_colors,
+                                            linewidths=2, alpha=0.7, rasterized=True))
+
+        # Plot planets
+        planet_sizes = self._marker_size_outer
+        ax.scatter(xs, ys, color=planet_colors, s=planet_sizes, edgecolors=edge_colors, linewidth=2)
+
+        # Legend stand-ins for each orbit followed by its planet
+        handles = [sun]
+        for k, orbit_color, color, edge, size in zip(outer, orbit_colors, planet_colors,
+                                                     edge_colors, planet_sizes):
+            name = self.planet_names[k]
+            handles.append(Patch(facecolor='none', edgecolor=orbit_color, linewidth=2, alpha=0.7,
+                                 label=f"{name} Orbit"))
+            handles.append(Line2D([], [], linestyle='', marker='o', markersize=np.sqrt(size), color=color,
+                                  markeredgecolor=edge, markeredgewidth=2, label=name))
 
         ax.set_xlim(-6, 6)
         ax.set_ylim(-6, 6)
         ax.set_title('🪐 OUTER SOLAR SYSTEM (Log Scale)', color='white', fontsize=14, fontweight='bold')
-        ax.legend(facecolor='#1A1A4B', edgecolor='white', labelcolor='white')
-        ax.grid(True, alpha=0.2, color='white')
+        ax.legend(handles=handles, facecolor='#1A1A4B', edgecolor='white', labelcolor='white')
+        ax.set_axisbelow(True)
+        ax.grid(True, color=GRID_COLOR)
 
     def _plot_size_comparison_3d(self, ax):
         """3D-style size comparison with perspective"""
-        planets = []
-        sizes = []
-        colors = []
-
-        for planet_name, planet_data in self.planet_data.items():
-            if planet_data['type'] == 'planet':
-                planets.append(planet_data['name'])
-                # Normalize sizes for better visualization
-                sizes.append(np.sqrt(planet_data['radius'] / 1e6) * 50)
-                colors.append(self.planet_colors[planet_name][1])
+        planets = self.planet_names
+        # Normalize sizes for better visualization
+        sizes = np.sqrt(self.p_radius / 1e6) * 50
 
         # Create 3D-like bars with shadows
         y_pos = np.arange(len(planets))
 
         # Main bars
-        bars = ax.barh(y_pos, sizes, color=colors, alpha=0.8, edgecolor='white', linewidth=1)
+        bars = ax.barh(y_pos, sizes, color=self.p_fill_colors, alpha=0.8, edgecolor='white', linewidth=1)
 
         # Add shadow effect
         for i, bar in enumerate(bars):
@@ -205,222 +301,228 @@ class UltraRealisticVisualizer:
         ax.set_yticklabels(planets, color='white')
         ax.set_facecolor('#0B0B3B')
         ax.set_title('📊 PLANETARY SIZE COMPARISON', color='white', fontsize=12, fontweight='bold')
-        ax.grid(True, alpha=0.2, color='white', axis='x')
+        ax.set_axisbelow(True)
+        ax.grid(True, color=GRID_COLOR, axis='x')
 
     def _plot_velocity_heatmap(self, ax):
         """Orbital velocity visualization as heatmap"""
-        planets = []
-        velocities = []
-        colors = []
-
-        for planet_name, planet_data in self.planet_data.items():
-            if planet_data['type'] == 'planet':
-                planets.append(planet_data['name'])
-                # Calculate approximate orbital velocity (km/s)
-                a = planet_data['semi_major_axis']
-                orbital_velocity = np.sqrt(6.67430e-11 * 1.989e30 / a) / 1000
-                velocities.append(orbital_velocity)
-                colors.append(self.planet_colors[planet_name][1])
+        planets = self.planet_names
+        velocities = self.p_orbital_velocity_kms
 
         # Create heatmap-style bars
         y_pos = np.arange(len(planets))
-        bars = ax.barh(y_pos, velocities, color=colors, alpha=0.8)
+        bars = ax.barh(y_pos, velocities, color=self.p_fill_colors, alpha=0.8)
 
         # Add value labels
-        for i, (bar, vel) in enumerate(zip(bars, velocities)):
-            ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height() / 2,
-                    f'{vel:.1f} km/s', ha='left', va='center', color='white', fontsize=9)
+        ax.bar_label(bars, labels=self._vel_labels, padding=3,
+                     color='white', fontsize=9)
 
         ax.set_yticks(y_pos)
         ax.set_yticklabels(planets, color='white')
         ax.set_facecolor('#0B0B3B')
         ax.set_title('🚀 ORBITAL VELOCITIES', color='white', fontsize=12, fontweight='bold')
-        ax.grid(True, alpha=0.2, color='white', axis='x')
+        ax.set_axisbelow(True)
+        ax.grid(True, color=GRID_COLOR, axis='x')
 
     def _plot_temperature_gradient(self, ax):
         """Temperature gradient across solar system"""
-        planets = []
-        temperatures = [440, 737, 288, 210, 165, 134, 76, 72]  # Average temps in Kelvin
-        colors = []
-
-        planet_names = ['mercury', 'venus', 'earth', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune']
-
-        for i, planet_name in enumerate(planet_names):
-            planets.append(self.planet_data[planet_name]['name'])
-            colors.append(self.planet_colors[planet_name][1])
+        planets = self.planet_names
+        temperatures = self.p_temp_k
 
         # Create gradient bars
         y_pos = np.arange(len(planets))
-        bars = ax.barh(y_pos, temperatures, color=colors, alpha=0.8)
+        bars = ax.barh(y_pos, temperatures, color=self.p_fill_colors, alpha=0.8)
 
         # Add temperature labels
-        for i, (bar, temp) in enumerate(zip(bars, temperatures)):
-            ax.text(bar.get_width() + 10, bar.get_y() + bar.get_height() / 2,
-                    f'{temp}K', ha='left', va='center', color='white', fontsize=9)
+        ax.bar_label(bars, labels=self._temp_labels, padding=3,
+                     color='white', fontsize=9)
 
         ax.set_yticks(y_pos)
         ax.set_yticklabels(planets, color='white')
         ax.set_facecolor('#0B0B3B')
         ax.set_title('🌡️ AVERAGE TEMPERATURES', color='white', fontsize=12, fontweight='bold')
-        ax.grid(True, alpha=0.2, color='white', axis='x')
+        ax.set_axisbelow(True)
+        ax.grid(True, color=GRID_COLOR, axis='x')
 
     def _plot_composition_chart(self, ax):
         """Planetary composition visualization"""
-        # Simplified composition data (rock/gas/ice percentages)
-        compositions = {
-            'mercury': [70, 30, 0], 'venus': [65, 35, 0], 'earth': [67, 33, 0], 'mars': [60, 40, 0],
-            'jupiter': [10, 90, 0], 'saturn': [15, 85, 0], 'uranus': [20, 30, 50], 'neptune': [25, 35, 40]
-        }
-
-        planets = []
-        for planet_name in ['mercury', 'venus', 'earth', 'mars', 'jupiter', 'saturn', 'uranus', 'neptune']:
-            planets.append(self.planet_data[planet_name]['name'])
-
-        # Create stacked bar chart
-        rock = [comp[0] for comp in compositions.values()]
-        gas = [comp[1] for comp in compositions.values()]
-        ice = [comp[2] for comp in compositions.values()]
+        planets = self.planet_names
 
+        # Create stacked bar chart, one segment per rock/gas/ice column
         y_pos = np.arange(len(planets))
-
-        ax.barh(y_pos, rock, color='#8B4513', alpha=0.8, label='Rock')
-        ax.barh(y_pos, gas, left=rock, color='#87CEEB', alpha=0.8, label='Gas')
-        ax.barh(y_pos, ice, left=np.array(rock) + np.array(gas), color='#F0F8FF', alpha=0.8, label='Ice')
+        for k, (label, color) in enumerate((('Rock', '#8B4513'), ('Gas', '#87CEEB'), ('Ice', '#F0F8FF'))):
+            ax.barh(y_pos, self.p_composition[:, k], left=self._composition_left[:, k],
+                    color=color, alpha=0.8, label=label)
 
         ax.set_yticks(y_pos)
         ax.set_yticklabels(planets, color='white')
         ax.set_facecolor('#0B0B3B')
         ax.set_title('🏗️ PLANETARY COMPOSITION', color='white', fontsize=12, fontweight='bold')
         ax.legend(facecolor='#1A1A4B', edgecolor='white', labelcolor='white', fontsize=8)
-        ax.grid(True, alpha=0.2, color='white', axis='x')
+        ax.set_axisbelow(True)
+        ax.grid(True, color=GRID_COLOR, axis='x')
 
     def _plot_discovery_timeline(self, ax):
         """Historical timeline of planetary discoveries"""
-        discoveries = {
-            'Mercury': -3000, 'Venus': -3000, 'Mars': -3000, 'Jupiter': -3000, 'Saturn': -3000,
-            'Uranus': 1781, 'Neptune': 1846
-        }
-
-        planets = list(discoveries.keys())
-        years = list(discoveries.values())
-        colors = [self.planet_colors[planet.lower()][1] for planet in planets]
+        planets = np.compress(self._discovered, self.planet_names)
+        years = self.p_discovery_year
 
         # Create timeline
         y_pos = np.arange(len(planets))
-        bars = ax.barh(y_pos, years, color=colors, alpha=0.8)
+        bars = ax.barh(y_pos, years, color=self.p_fill_colors[self._discovered], alpha=0.8)
 
-        # Add year labels
-        for i, (bar, year) in enumerate(zip(bars, years)):
-            label_x = bar.get_width() + 100 if year > 0 else bar.get_width() - 500
-            ax.text(label_x, bar.get_y() + bar.get_height() / 2,
-                    f'{abs(year)} {"BCE" if year < 0 else "CE"}',
-                    ha='left' if year > 0 else 'right', va='center', color='white', fontsize=10)
+        # Add year labels; bar_label puts them past the end of each bar,
+        # on the left for the BCE bars
+        ax.bar_label(bars, labels=self._discovery_labels, padding=4, color='white', fontsize=10)
 
         ax.set_yticks(y_pos)
         ax.set_yticklabels(planets, color='white')
         ax.set_facecolor('#0B0B3B')
         ax.set_title('📅 DISCOVERY TIMELINE', color='white', fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.2, color='white', axis='x')
+        ax.set_axisbelow(True)
+        ax.grid(True, color=GRID_COLOR, axis='x')
         ax.axvline(x=0, color='white', linestyle='--', alpha=0.5)
         ax.text(0, len(planets) - 0.5, 'Common Era', color='white', ha='center', fontsize=8)
 
     def _create_starfield(self, ax, num_stars=100):
-        """Create realistic starfield background"""
-        x_stars = np.random.uniform(-10, 10, num_stars)
-        y_stars = np.random.uniform(-10, 10, num_stars)
-        sizes = np.random.uniform(0.5, 3, num_stars)
-        brightness = np.random.uniform(0.3, 1.0, num_stars)
-
-        ax.scatter(x_stars, y_stars, s=sizes, c='white', alpha=brightness, marker='*')
+        """Create realistic starfield background
+
+        Faint stars are single pixels from a marker-only line, which
+        scatter() cannot draw. The brighter ones keep a per-star size and
+        a brightness baked into RGBA colours, as a scatter with the cheap
+        point marker. Both are rasterized, being only background.
+        """
+        starfield = self._starfields.get(num_stars)
+        if starfield is None:
+            # One draw for every column: x, y, size, brightness
+            stars = self._rng.random((num_stars, 4))
+            stars[:, :2] *= 20
+            stars[:, :2] -= 10
+            stars[:, 2] *= 2.5
+            stars[:, 2] += 0.5
+            small = stars[:, 2] < 1.5
+            rgba = np.ones((num_stars - small.sum(), 4))
+            rgba[:, 3] = stars[~small, 3] * 0.7 + 0.3
+            starfield = self._starfields[num_stars] = stars[small, :2].T, stars[~small], rgba
+        pixels, bright, rgba = starfield
+
+        ax.plot(*pixels, linestyle='', marker=',', color='white', alpha=0.5, rasterized=True)
+        ax.scatter(bright[:, 0], bright[:, 1], s=bright[:, 2], c=rgba, marker='.', linewidths=0,
+                   rasterized=True)
 
     def create_interactive_3d_masterpiece(self):
-        """Create an ultra-realistic interactive 3D visualization"""
-        fig = go.Figure()
-
-        # Add starfield background
-        star_x = np.random.uniform(-50, 50, 1000)
-        star_y = np.random.uniform(-50, 50, 1000)
-        star_z = np.random.uniform(-50, 50, 1000)
-        star_size = np.random.uniform(0.5, 2, 1000)
-
-        fig.add_trace(go.Scatter3d(
-            x=star_x, y=star_y, z=star_z,
-            mode='markers',
-            marker=dict(
-                size=star_size,
-                color='white',
-                opacity=0.7
-            ),
-            name='Stars',
-            showlegend=False
-        ))
+        """Create an ultra-realistic interactive 3D visualization
+
+        Traces and layout are plain dicts handed to go.Figure with
+        validation switched off, the way plotly loads its own templates.
+        Property validation dominated the build time, and everything here
+        is a fixed, known-good structure, so keys must be spelled out in
+        full (no magic underscores such as xaxis_title).
+        """
+        # Plotly is slow to import and only needed here
+        import plotly.graph_objects as go
+
+        data = []
+
+        # Add starfield background: x, y, z and marker size per star
+        if self._starfield_3d is None:
+            stars = self._rng.random((1000, 4))
+            stars[:, :3] *= 100
+            stars[:, :3] -= 50
+            stars[:, 3] *= 1.5
+            stars[:, 3] += 0.5
+            self._starfield_3d = stars
+        star_x, star_y, star_z, star_size = self._starfield_3d.T
+
+        data.append({
+            'type': 'scatter3d',
+            'x': star_x, 'y': star_y, 'z': star_z,
+            'mode': 'markers',
+            'marker': {'size': star_size, 'color': 'white', 'opacity': 0.7},
+            'name': 'Stars',
+            'showlegend': False,
+        })
 
         # Add planets with realistic orbits
-        for planet_name, planet_data in self.planet_data.items():
-            if planet_data['type'] == 'planet':
-                a = planet_data['semi_major_axis'] / AU
-                e = planet_data['eccentricity']
-                inclination = np.radians(self.orbital_inclinations.get(planet_name, 0))
-
-                # Generate realistic elliptical orbit
-                theta = np.linspace(0, 2 * np.pi, 200)
-                r = a * (1 - e ** 2) / (1 + e * np.cos(theta))
-
-                # 3D coordinates with inclination
-                x = r * np.cos(theta)
-                y = r * np.sin(theta) * np.cos(inclination)
-                z = r * np.sin(theta) * np.sin(inclination)
-
-                # Add orbit
-                fig.add_trace(go.Scatter3d(
-                    x=x, y=y, z=z,
-                    mode='lines',
-                    line=dict(color=self.planet_colors[planet_name][0], width=4),
-                    name=f"{planet_data['name']} Orbit",
-                    showlegend=True
-                ))
-
-                # Add planet with realistic size
-                planet_size = max(3, np.log(planet_data['radius'] / 1e7) * 8)
-                fig.add_trace(go.Scatter3d(
-                    x=[x[0]], y=[y[0]], z=[z[0]],
-                    mode='markers',
-                    marker=dict(
-                        size=planet_size,
-                        color=self.planet_colors[planet_name][1],
-                        line=dict(color=self.planet_colors[planet_name][2], width=2)
-                    ),
-                    name=planet_data['name']
-                ))
+        n_planets = len(self.planet_order)
+        a = self.p_a_AU
+        e = self.p_ecc
+        inclination = self.p_inclination
+
+        # Generate realistic elliptical orbits, inclined about the x axis,
+        # as 3D coordinates of shape (planets, samples, 3)
+        if kernels.NUMBA_AVAILABLE:
+            # One fused compiled pass per orbit
+            orbits = np.stack([np.column_stack(kernels.kepler_xyz(a[k], e[k], inclination[k], 0.0, 0.0,
+                                                                  _COS_T, _SIN_T))
+                               for k in range(n_planets)])
+        else:
+            r = (a * (1 - e ** 2))[:, None] / (1 + e[:, None] * _COS_T)
+            inclination = inclination[:, None]
+            orbits = np.stack((r * _COS_T,
+                               r * _SIN_T * np.cos(inclination),
+                               r * _SIN_T * np.sin(inclination)), axis=-1)
+
+        # All orbits go into one line trace, with a NaN point after each
+        # orbit so Plotly breaks the line between planets
+        gap = np.full((1, 3), np.nan)
+        path = np.concatenate([np.vstack((orbit, gap)) for orbit in orbits])
+
+        # Per-point colour and hover label, repeated over each orbit's points
+        counts = [len(orbit) + 1 for orbit in orbits]
+        orbit_colors = np.repeat(self.p_orbit_colors, counts).tolist()
+        orbit_names = np.repeat([f"{name} Orbit" for name in self.planet_names], counts).tolist()
+
+        data.append({
+            'type': 'scatter3d',
+            'x': path[:, 0], 'y': path[:, 1], 'z': path[:, 2],
+            'mode': 'lines',
+            'line': {'color': orbit_colors, 'width': 4},
+            'text': orbit_names,
+            'hoverinfo': 'text',
+            'name': 'Orbits',
+        })
+
+        # Add planets with realistic size, each at the start of its orbit
+        start = orbits[:, 0]
+        data.append({
+            'type': 'scatter3d',
+            'x': start[:, 0], 'y': start[:, 1], 'z': start[:, 2],
+            'mode': 'markers',
+            'marker': {
+                'size': np.maximum(3, np.log(self.p_radius / 1e7) * 8),
+                'color': self.p_fill_colors.tolist(),
+                'line': {'color': self.p_edge_colors.tolist(), 'width': 2},
+            },
+            'text': self.planet_names,
+            'hoverinfo': 'text',
+            'name': 'Planets',
+        })
 
         # Add spectacular sun
-        fig.add_trace(go.Scatter3d(
-            x=[0], y=[0], z=[0],
-            mode='markers',
-            marker=dict(
-                size=20,
-                color='#FFD700',
-                opacity=0.9
-            ),
-            name='Sun'
-        ))
-
-        fig.update_layout(
-            title='🌠 ULTRA-REALISTIC 3D SOLAR SYSTEM MASTERPIECE 🌠',
-            scene=dict(
-                xaxis_title='X (AU)',
-                yaxis_title='Y (AU)',
-                zaxis_title='Z (AU)',
-                bgcolor='#0B0B3B',
-                xaxis=dict(color='white'),
-                yaxis=dict(color='white'),
-                zaxis=dict(color='white'),
-            ),
-            width=1200,
-            height=800,
-            paper_bgcolor='#0B0B3B',
-            font=dict(color='white')
-        )
+        data.append({
+            'type': 'scatter3d',
+            'x': [0], 'y': [0], 'z': [0],
+            'mode': 'markers',
+            'marker': {'size': 20, 'color': '#FFD700', 'opacity': 0.9},
+            'name': 'Sun',
+        })
+
+        layout = {
+            'title': {'text': '🌠 ULTRA-REALISTIC 3D SOLAR SYSTEM MASTERPIECE 🌠'},
+            'scene': {
+                'xaxis': {'title': {'text': 'X (AU)'}, 'color': 'white'},
+                'yaxis': {'title': {'text': 'Y (AU)'}, 'color': 'white'},
+                'zaxis': {'title': {'text': 'Z (AU)'}, 'color': 'white'},
+                'bgcolor': '#0B0B3B',
+            },
+            'width': 1200,
+            'height': 800,
+            'paper_bgcolor': '#0B0B3B',
+            'font': {'color': 'white'},
+        }
+
+        fig = go.Figure(data=data, layout=layout, _validate=False)
 
         return fig
 
@@ -438,8 +540,7 @@ def main():
 
     print("1. 🎨 Creating Galactic Overview Dashboard...")
     fig1 = ultra_viz.create_galactic_overview()
-    plt.savefig('ULTRA_REALISTIC_GALACTIC_OVERVIEW.png', dpi=300, bbox_inches='tight',
-                facecolor='#0B0B3B', edgecolor='none')
+    plt.savefig('ULTRA_REALISTIC_GALACTIC_OVERVIEW.png', dpi=DPI)
 
     print("2. 🚀 Creating Interactive 3D Masterpiece...")
     fig2 = ultra_viz.create_interactive_3d_masterpiece()
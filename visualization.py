@@ -1,9 +1,11 @@
 import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import matplotlib.animation as animation
-from data.constants import AU
+import os
+from data.constants import AU, INV_AU
+
+# Orbit paths are decimated to roughly this many points for drawing
+MAX_PATH_POINTS = 200
 
 
 class SolarSystemVisualizer:
@@ -11,6 +13,9 @@ class SolarSystemVisualizer:
         self.solar_system = solar_system
         self.fig = None
         self.ax = None
+        self._orbit_artists = {}
+        self._marker_artists = {}
+        self.animation_path = None
 
     def create_static_plot(self, time_index=-1):
         """Create a static plot of the solar system"""
@@ -20,48 +25,91 @@ class SolarSystemVisualizer:
         self.solar_system.update_bodies_from_solution(time_index)
 
         # Plot 1: Solar System View
-        self._plot_solar_system_view(ax[0])
+        self._orbit_artists, self._marker_artists = self._plot_solar_system_view(ax[0])
 
         # Plot 2: Orbital Parameters
         self._plot_orbital_parameters(ax[1])
 
         plt.tight_layout()
+
+        # Keep the figure so update_static_plot can reuse its artists
+        self.fig, self.ax = fig, ax
         return fig, ax
 
+    def update_static_plot(self, time_index=-1):
+        """Refresh the cached static plot in place instead of rebuilding it"""
+        if self.fig is None:
+            return self.create_static_plot(time_index)
+
+        self.solar_system.update_bodies_from_solution(time_index)
+        positions_au = self.solar_system.positions * INV_AU
+        stride = self._path_stride()
+
+        for i, line in self._orbit_artists.items():
+            trajectory_au = self.solar_system.get_body_trajectory(i)[::stride]
+            line.set_data(trajectory_au[:, 0], trajectory_au[:, 1])
+
+        for marker, indices in self._marker_artists.items():
+            marker.set_offsets(positions_au[indices, :2])
+
+        self.fig.canvas.draw_idle()
+        return self.fig, self.ax
+
+    def _path_stride(self):
+        """Step between trajectory samples drawn for orbit paths"""
+        return max(1, len(self.solar_system.simulation_time) // MAX_PATH_POINTS)
+
     def _plot_solar_system_view(self, ax):
-        """Plot the solar system view"""
+        """Plot the solar system view
+
+        Returns the orbit lines keyed by body index, and the position
+        marker collections mapped to the body indices they draw.
+        """
         ax.set_title('Solar System', fontsize=16, fontweight='bold')
         ax.set_xlabel('Distance (AU)')
         ax.set_ylabel('Distance (AU)')
         ax.grid(True, alpha=0.3)
         ax.set_aspect('equal')
 
-        # Plot orbits and current positions
-        for i, body in enumerate(self.solar_system.bodies):
-            if body.type == 'planet':
-                # Plot orbit trajectory
-                trajectory = self.solar_system.get_body_trajectory(i)
-                trajectory_au = trajectory / AU
-                ax.plot(trajectory_au[:, 0], trajectory_au[:, 1],
-                        color=body.color, alpha=0.5, linewidth=1)
-
-                # Plot current position
-                current_pos = body.position / AU
-                ax.scatter(current_pos[0], current_pos[1],
-                           color=body.color, s=100, label=body.name,
-                           edgecolors='black', linewidth=0.5)
+        positions_au = self.solar_system.positions * INV_AU
+        stride = self._path_stride()
+        orbit_artists = {}
+        marker_artists = {}
+
+        # Plot orbit trajectories
+        planets = np.flatnonzero(self.solar_system.types == 'planet')
+        bodies = [self.solar_system.bodies[i] for i in planets]
+        for i, body in zip(planets, bodies):
+            trajectory_au = self.solar_system.get_body_trajectory(i)[::stride]
+            orbit_artists[i], = ax.plot(trajectory_au[:, 0], trajectory_au[:, 1],
+                                        color=body.color, alpha=0.5, linewidth=1)
+
+        # Plot current positions of every planet in one scatter
+        colors = [body.color for body in bodies]
+        planet_markers = ax.scatter(positions_au[planets, 0], positions_au[planets, 1],
+                                    color=colors, s=100, edgecolors='black', linewidth=0.5)
+        marker_artists[planet_markers] = planets
+
+        # The batched scatter has no per-planet labels; legend stand-ins
+        handles = [Line2D([], [], linestyle='', marker='o', markersize=10, color=body.color,
+                          markeredgecolor='black', markeredgewidth=0.5, label=body.name)
+                   for body in bodies]
 
         # Plot sun
         sun = self.solar_system.get_sun()
         if sun:
-            sun_pos = sun.position / AU
-            ax.scatter(sun_pos[0], sun_pos[1], color=sun.color, s=300,
-                       label=sun.name, edgecolors='black', linewidth=1)
+            sun_pos = positions_au[sun.index]
+            sun_marker = ax.scatter(sun_pos[0], sun_pos[1], color=sun.color, s=300,
+                                    label=sun.name, edgecolors='black', linewidth=1)
+            marker_artists[sun_marker] = [sun.index]
+            handles.append(sun_marker)
 
-        ax.legend()
+        ax.legend(handles=handles)
         ax.set_xlim(-35, 35)
         ax.set_ylim(-35, 35)
 
+        return orbit_artists, marker_artists
+
     def _plot_orbital_parameters(self, ax):
         """Plot orbital parameters comparison"""
         planets_data = []
@@ -93,13 +141,18 @@ class SolarSystemVisualizer:
 
     def create_3d_plotly_visualization(self):
         """Create an interactive 3D visualization using Plotly"""
+        # Plotly is slow to import and only needed here
+        import plotly.graph_objects as go
+
         fig = go.Figure()
+        positions_au = self.solar_system.positions * INV_AU
+        # Smooth orbits look the same decimated, and every point is shipped to the browser
+        stride = self._path_stride()
 
         # Add orbits and planets
         for i, body in enumerate(self.solar_system.bodies):
             if body.type == 'planet':
-                trajectory = self.solar_system.get_body_trajectory(i)
-                trajectory_au = trajectory / AU
+                trajectory_au = self.solar_system.get_body_trajectory(i)[::stride]
 
                 # Add orbit trace
                 fig.add_trace(go.Scatter3d(
@@ -113,7 +166,7 @@ class SolarSystemVisualizer:
                 ))
 
                 # Add current position
-                current_pos = body.position / AU
+                current_pos = positions_au[i]
                 fig.add_trace(go.Scatter3d(
                     x=[current_pos[0]],
                     y=[current_pos[1]],
@@ -130,7 +183,7 @@ class SolarSystemVisualizer:
         # Add sun
         sun = self.solar_system.get_sun()
         if sun:
-            sun_pos = sun.position / AU
+            sun_pos = positions_au[sun.index]
             fig.add_trace(go.Scatter3d(
                 x=[sun_pos[0]],
                 y=[sun_pos[1]],
@@ -159,22 +212,47 @@ class SolarSystemVisualizer:
         return fig
 
     def create_animation(self, save_path=None):
-        """Create an animation of the solar system"""
+        """Create an animation of the solar system.
+
+        When save_path is given the animation is written there, or next to
+        it as a GIF if ffmpeg is missing; the path actually written is kept
+        in animation_path.
+        """
+        import matplotlib.animation as animation
+
         fig, ax = plt.subplots(figsize=(10, 10))
 
+        # Build the scene once; frames only move the position markers
+        self.solar_system.update_bodies_from_solution(0)
+        _, marker_artists = self._plot_solar_system_view(ax)
+        time_text = ax.text(0.02, 0.98, '', transform=ax.transAxes, va='top')
+
+        history_pos = self.solar_system.history_pos
+        simulation_time = self.solar_system.simulation_time
+
         def animate(frame):
-            ax.clear()
-            self.solar_system.update_bodies_from_solution(frame)
-            self._plot_solar_system_view(ax)
-            ax.set_title(f'Solar System - Time: {self.solar_system.simulation_time[frame]:.1f} days')
+            positions_au = history_pos[frame]
+            for marker, indices in marker_artists.items():
+                marker.set_offsets(positions_au[indices, :2])
+            time_text.set_text(f'Time: {simulation_time[frame]:.1f} days')
+            return list(marker_artists) + [time_text]
 
-        n_frames = len(self.solar_system.simulation_time)
+        n_frames = len(simulation_time)
         anim = animation.FuncAnimation(
-            fig, animate, frames=min(100, n_frames), interval=50, repeat=True
+            fig, animate, frames=min(100, n_frames), interval=50, repeat=True, blit=True
         )
 
         if save_path:
-            anim.save(save_path, writer='pillow', fps=20)
+            if animation.FFMpegWriter.isAvailable():
+                writer = animation.FFMpegWriter(fps=20, codec='libx264', bitrate=2000)
+            else:
+                # Without ffmpeg fall back to Pillow, which can only write GIFs
+                gif_path = os.path.splitext(save_path)[0] + '.gif'
+                print(f"ffmpeg not found; saving the animation as '{gif_path}' instead of '{save_path}'")
+                save_path = gif_path
+                writer = animation.PillowWriter(fps=20)
+            anim.save(save_path, writer=writer)
+            self.animation_path = save_path
 
         return anim
 